@@ -4,48 +4,70 @@ Demo script to showcase the different UI themes available.
 """
 
 import sys
-import os
-from pathlib import Path
-
-# Add the src directory to the path
-src_path = Path(__file__).parent / 'src'
-sys.path.insert(0, str(src_path))
 
 from xcom_save_editor.ui import UIRenderer, set_theme, get_available_themes
 from rich.console import Console
 
 
+_HEADER_BAR = "=" * 60
+_FOOTER_BAR = "\n" + "─" * 60 + "\n"
+
+_SAMPLE_SAVE_INFO = {
+    "save_name": "Demo Save",
+    "game_version": "Extended 8.3.4",
+    "game_engine": "Extended",
+    "difficulty": 1,
+    "months_passed": 5,
+    "days_passed": 127,
+    "total_bases": 4,
+    "base_names": ["Alpha Base", "Bravo Station", "Charlie Outpost", "Delta Command"],
+    "size": 245760,
+    "backups_available": 3
+}
+
+_SAMPLE_STATUS = {
+    "Funds": {"Current": 2500000, "Previous": 1800000},
+    "Research": {"Active": 8, "Completed": 45},
+    "Facilities": {"Building": 2, "Completed": 28},
+    "Production": {"Active": 5, "Total": 15},
+    "Bases": {"Total": 4, "Names": ["Alpha", "Bravo", "Charlie", "Delta"]},
+    "Soldiers": {"Total": 24, "Deployed": 8}
+}
+
+_SAMPLE_DATA = [
+    {"name": "Plasma Rifle", "quantity": 12, "type": "Weapon"},
+    {"name": "Alien Alloys", "quantity": 45, "type": "Material"},
+    {"name": "Elerium-115", "quantity": 8, "type": "Material"},
+    {"name": "Power Suit", "quantity": 6, "type": "Armor"}
+]
+
+_SAMPLE_SHORTCUTS = {
+    "s": "Status", "m": "Money", "r": "Research", 
+    "q": "Quit", "h": "Help", "t": "Theme"
+}
+
+# One console/renderer pair shared by every theme; refresh_theme() re-skins it
+_CONSOLE = Console()
+_RENDERER = UIRenderer(_CONSOLE)
+
+
 def demo_theme(theme_name: str):
     """Demo a specific theme."""
-    print(f"\n{'='*60}")
+    print()
+    print(_HEADER_BAR)
     print(f"Theme: {theme_name.upper()}")
-    print(f"{'='*60}")
+    print(_HEADER_BAR)
     
-    # Set the theme
+    # Set the theme and re-skin the shared renderer
     set_theme(theme_name)
-    
-    # Create renderer
-    console = Console()
-    renderer = UIRenderer(console)
+    renderer = _RENDERER
+    renderer.refresh_theme()
     
     # Demo welcome screen
     renderer.render_welcome_screen("OpenXCom Save Editor v2.0", "Enhanced UI Demo")
     
     # Demo save info
-    sample_save_info = {
-        "save_name": "Demo Save",
-        "game_version": "Extended 8.3.4",
-        "game_engine": "Extended",
-        "difficulty": 1,
-        "months_passed": 5,
-        "days_passed": 127,
-        "total_bases": 4,
-        "base_names": ["Alpha Base", "Bravo Station", "Charlie Outpost", "Delta Command"],
-        "size": 245760,
-        "backups_available": 3
-    }
-    
-    renderer.render_save_info(sample_save_info)
+    renderer.render_save_info(_SAMPLE_SAVE_INFO)
     
     # Demo status messages
     renderer.render_success_message("Save loaded successfully")
@@ -54,55 +76,50 @@ def demo_theme(theme_name: str):
     renderer.render_error_message("Failed to create backup")
     
     # Demo status dashboard
-    sample_status = {
-        "Funds": {"Current": 2500000, "Previous": 1800000},
-        "Research": {"Active": 8, "Completed": 45},
-        "Facilities": {"Building": 2, "Completed": 28},
-        "Production": {"Active": 5, "Total": 15},
-        "Bases": {"Total": 4, "Names": ["Alpha", "Bravo", "Charlie", "Delta"]},
-        "Soldiers": {"Total": 24, "Deployed": 8}
-    }
-    
-    renderer.render_status_dashboard(sample_status)
+    renderer.render_status_dashboard(_SAMPLE_STATUS)
     
     # Demo table
-    sample_data = [
-        {"name": "Plasma Rifle", "quantity": 12, "type": "Weapon"},
-        {"name": "Alien Alloys", "quantity": 45, "type": "Material"},
-        {"name": "Elerium-115", "quantity": 8, "type": "Material"},
-        {"name": "Power Suit", "quantity": 6, "type": "Armor"}
-    ]
-    
     renderer.render_table_with_data(
-        data=sample_data,
+        data=_SAMPLE_DATA,
         title="🎯 Sample Inventory",
         columns=["name", "quantity", "type"]
     )
     
     # Demo footer with shortcuts
-    shortcuts = {
-        "s": "Status", "m": "Money", "r": "Research", 
-        "q": "Quit", "h": "Help", "t": "Theme"
-    }
-    
     renderer.render_footer(
         status=f"Theme: {theme_name.title()} | Demo Mode Active",
-        shortcuts=shortcuts
+        shortcuts=_SAMPLE_SHORTCUTS
     )
     
-    print("\n" + "─" * 60 + "\n")
+    print(_FOOTER_BAR)
 
 
 def main():
-    """Run the theme demo."""
+    """Run the theme demo.
+    
+    Usage: demo_themes.py [--no-pause] [theme_name]
+    """
     print("OpenXCom Save Editor - UI Theme Showcase")
     print("This demo shows all available themes with sample data.")
     
     themes = get_available_themes()
+    args = [arg for arg in sys.argv[1:] if arg != "--no-pause"]
+    
+    # Render a single theme when one is named (handy for startup profiling)
+    if args:
+        if args[0] not in themes:
+            print(f"Unknown theme: {args[0]}")
+            print(f"Available themes: {', '.join(themes)}")
+            return
+        demo_theme(args[0])
+        return
+    
+    # Only pause between themes when someone is at the keyboard
+    interactive = sys.stdin.isatty() and "--no-pause" not in sys.argv
     
     for theme in themes:
         demo_theme(theme)
-        if theme != themes[-1]:  # Not the last theme
+        if interactive and theme != themes[-1]:  # Not the last theme
             input("Press Enter to see next theme...")
     
     print("Theme showcase complete!")
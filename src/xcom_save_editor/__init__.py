@@ -9,7 +9,24 @@ __version__ = "1.0.0"
 __author__ = "OpenXCom Save Editor"
 __description__ = "A safe save editor for OpenXCom games with X-Com Files mod support"
 
-from .editor import OpenXComSaveEditor
-from .cli import SaveEditorCLI
+__all__ = ["OpenXComSaveEditor", "SaveEditorCLI"]
 
-__all__ = ["OpenXComSaveEditor", "SaveEditorCLI"]
\ No newline at end of file
+# Public names resolved on first access so ``import xcom_save_editor`` stays cheap
+_LAZY = {
+    "OpenXComSaveEditor": ".editor",
+    "SaveEditorCLI": ".cli",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
@@ -2,10 +2,10 @@
 Main entry point for running the OpenXCom Save Editor as a module.
 
 Usage:
-    python -m xcom_save_editor
+    python -m xcom_save_editor [--theme NAME] [--legacy]
 """
 
-from .cli import main
+from .enhanced_cli import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,28 +1,216 @@
 """
 Interactive CLI interface for the OpenXCom save editor.
 """
+import heapq
 import os
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from InquirerPy import inquirer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich import print as rprint
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from rich.console import Console
+    from .editor import OpenXComSaveEditor
 
-from .editor import OpenXComSaveEditor
+
+# InquirerPy and Rich are slow to import, so they are only loaded once a
+# prompt or a print actually needs them.
+
+class _LazyInquirer:
+    """Stand-in for ``InquirerPy.inquirer`` that imports it on first use."""
+    
+    def __getattr__(self, name: str) -> Any:
+        from InquirerPy import inquirer as _inquirer
+        return getattr(_inquirer, name)
+
+
+inquirer = _LazyInquirer()
+
+
+def rprint(*objects: Any, **kwargs: Any) -> None:
+    """Lazy wrapper around ``rich.print``."""
+    from rich import print as rich_print
+    rich_print(*objects, **kwargs)
+
+
+def pause(message: str = "Press Enter to continue...") -> None:
+    """Wait for Enter with a plain ``input()``; no prompt widget needed for pacing."""
+    try:
+        input(message)
+    except EOFError:
+        pass
+
+
+def _validate_sav_path(path: str) -> bool:
+    """Filepath prompt validator: an existing file with a .sav extension (name checked before any stat)."""
+    return path.lower().endswith('.sav') and os.path.isfile(path)
+
+
+_SOLDIER_STATS: Optional[Tuple[Tuple[str, str], ...]] = None
+
+
+def _get_soldier_stats() -> Tuple[Tuple[str, str], ...]:
+    """``(stat_name, display_label)`` for every soldier stat, resolved on first use."""
+    global _SOLDIER_STATS
+    if _SOLDIER_STATS is None:
+        from .game_editors.soldier_manager import Soldier
+        _SOLDIER_STATS = tuple(
+            (stat_name, stat_name.replace('psi', 'Psi ').replace('Strength', ' Strength').replace('Skill', ' Skill').title())
+            for stat_name in Soldier.STATS
+        )
+    return _SOLDIER_STATS
+
+
+# Static menu choices, built once at import; each prompt gets a fresh list()
+_BACK_CHOICE = {"name": "Back", "value": "back"}
+
+_MAIN_MENU_CHOICES = (
+    {"name": "📊 Show Status", "value": "status"},
+    {"name": "💰 Edit Money/Funds", "value": "money"},
+    {"name": "🔬 Manage Research", "value": "research"},
+    {"name": "👤 Edit Soldiers/Agents", "value": "soldiers"},
+    {"name": "🏗️ Manage Facilities", "value": "facilities"},
+    {"name": "⚙️ Manage Production", "value": "production"},
+    {"name": "📦 Edit Inventory", "value": "inventory"},
+    {"name": "🗂️ Backup Management", "value": "backup"},
+    {"name": "💾 Save Changes", "value": "save"},
+    {"name": "↺ Reset All Changes", "value": "reset"},
+    {"name": "❌ Exit", "value": "exit"},
+)
+
+_MONEY_MENU_CHOICES = (
+    {"name": "Set new amount", "value": "set"},
+    {"name": "Add funds", "value": "add"},
+    {"name": "Back to main menu", "value": "back"},
+)
+
+# Tails of the "complete" menus; the first entry carries a live count
+_RESEARCH_MENU_TAIL = (
+    {"name": "Complete individual project", "value": "complete_individual"},
+    {"name": "Back to main menu", "value": "back"},
+)
+
+_FACILITIES_MENU_TAIL = (
+    {"name": "Complete individual facility", "value": "complete_individual"},
+    {"name": "Back to main menu", "value": "back"},
+)
+
+_PRODUCTION_MENU_TAIL = (
+    {"name": "Complete individual item", "value": "complete_individual"},
+    {"name": "Back to main menu", "value": "back"},
+)
+
+_SOLDIERS_MENU_TAIL = (
+    {"name": "Set custom max value for all soldiers", "value": "custom_all"},
+    {"name": "Edit individual soldier", "value": "individual"},
+    {"name": "Back to main menu", "value": "back"},
+)
+
+_SOLDIER_EDIT_CHOICES = (
+    {"name": "Set all stats to maximum (100)", "value": "max"},
+    {"name": "Set all stats to custom value", "value": "custom"},
+    {"name": "Edit individual stat", "value": "individual_stat"},
+    _BACK_CHOICE,
+)
+
+_INVENTORY_MENU_CHOICES = (
+    {"name": "Edit item quantity", "value": "edit_quantity"},
+    {"name": "Search for item", "value": "search"},
+    _BACK_CHOICE,
+)
+
+_BACKUP_MENU_CHOICES = (
+    {"name": "Create new backup", "value": "create"},
+    {"name": "Restore from backup", "value": "restore"},
+    {"name": "Back to main menu", "value": "back"},
+)
+
+_EXIT_CHOICES = (
+    {"name": "Save changes and exit", "value": "save"},
+    {"name": "Exit without saving", "value": "discard"},
+    {"name": "Cancel (don't exit)", "value": "cancel"},
+)
 
 
 class SaveEditorCLI:
     """Interactive CLI for the OpenXCom save editor."""
     
     def __init__(self):
-        self.console = Console()
-        self.editor: Optional[OpenXComSaveEditor] = None
+        self._console: Optional["Console"] = None
+        self.editor: Optional["OpenXComSaveEditor"] = None
         self.save_file_path: Optional[str] = None
+        
+        # editor.mutation_counter as of the last load/save/reset; any other value
+        # means unsaved edits
+        self._last_saved_counter = 0
+        
+        # Rich panels for show_status, built on first use
+        self._status_panels: Optional[Dict[str, Any]] = None
+        self._status_rows: tuple = ()
+        
+        # Backup listing runs in the background so menus are not held up by disk I/O
+        self._backup_executor: Optional["ThreadPoolExecutor"] = None
+        self._backup_future: Optional["Future"] = None
+    
+    @property
+    def console(self) -> "Console":
+        """Rich console, created on first use."""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
+    
+    def _sync_saved_counter(self):
+        """Record the editor's current state as matching the file on disk."""
+        self._last_saved_counter = self.editor.mutation_counter if self.editor else 0
+    
+    def _has_changes(self) -> bool:
+        """Whether anything was edited since the last load, save or reset (O(1))."""
+        if not self.editor:
+            return False
+        return self.editor.mutation_counter != self._last_saved_counter
+    
+    def _refresh_backups(self):
+        """Start listing backups in a worker thread; collected by ``_get_backups``."""
+        if self._backup_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._backup_executor = ThreadPoolExecutor(max_workers=1)
+        self._backup_future = self._backup_executor.submit(self.editor.get_available_backups)
+    
+    def _get_backups(self) -> List[Dict[str, Any]]:
+        """Backups from the background listing, or listed now if none is pending."""
+        # A finished listing is used once; after that the editor's mtime-checked
+        # cache picks up backups made since (e.g. by a save)
+        future, self._backup_future = self._backup_future, None
+        if future is None:
+            return self.editor.get_available_backups()
+        try:
+            return future.result()
+        except OSError:
+            return self.editor.get_available_backups()
+    
+    def _get_status_panels(self) -> Dict[str, Any]:
+        """Status panels and their column rows, built on first use and reused."""
+        if self._status_panels is None:
+            from rich.columns import Columns
+            from rich.panel import Panel
+            
+            self._status_panels = {
+                'funds': Panel("", title="💰 Funds", border_style="green"),
+                'research': Panel("", title="🔬 Research", border_style="blue"),
+                'facilities': Panel("", title="🏗️ Facilities", border_style="yellow"),
+                'production': Panel("", title="⚙️ Production", border_style="magenta"),
+                'bases': Panel("", title="🏠 Bases", border_style="cyan"),
+                'soldiers': Panel("", title="👤 Soldiers", border_style="red"),
+            }
+            panels = self._status_panels
+            self._status_rows = (
+                Columns([panels['funds'], panels['research']]),
+                Columns([panels['facilities'], panels['production']]),
+                Columns([panels['bases'], panels['soldiers']]),
+            )
+        return self._status_panels
     
     def run(self):
         """Main CLI loop."""
@@ -68,6 +256,9 @@ class SaveEditorCLI:
     
     def show_welcome(self):
         """Show welcome message."""
+        from rich.panel import Panel
+        from rich.text import Text
+        
         welcome_text = Text("OpenXCom Save Editor", style="bold blue")
         welcome_panel = Panel(
             welcome_text,
@@ -80,20 +271,23 @@ class SaveEditorCLI:
     
     def load_save_file(self) -> bool:
         """Load a save file."""
-        # Look for .sav files in current directory
-        current_dir = Path.cwd()
-        save_files = list(current_dir.glob("*.sav"))
+        # Look for .sav files in current directory (one scandir pass, no per-file stat)
+        with os.scandir(os.getcwd()) as entries:
+            save_files = [
+                entry.path for entry in entries
+                if entry.name.endswith('.sav') and entry.is_file()
+            ]
         
         if not save_files:
             rprint("[red]No .sav files found in the current directory.[/red]")
             file_path = inquirer.filepath(
                 message="Enter path to save file:",
-                validate=lambda path: Path(path).exists() and Path(path).suffix.lower() == '.sav',
+                validate=_validate_sav_path,
                 invalid_message="File must exist and have .sav extension"
             ).execute()
         else:
             # Show available save files
-            choices = [str(f) for f in save_files] + ["Browse for file..."]
+            choices = save_files + ["Browse for file..."]
             
             selected = inquirer.select(
                 message="Select save file:",
@@ -103,15 +297,19 @@ class SaveEditorCLI:
             if selected == "Browse for file...":
                 file_path = inquirer.filepath(
                     message="Enter path to save file:",
-                    validate=lambda path: Path(path).exists() and Path(path).suffix.lower() == '.sav',
+                    validate=_validate_sav_path,
                     invalid_message="File must exist and have .sav extension"
                 ).execute()
             else:
                 file_path = selected
         
         try:
+            from .editor import OpenXComSaveEditor
+            
             self.save_file_path = file_path
             self.editor = OpenXComSaveEditor(file_path)
+            self._sync_saved_counter()
+            self._refresh_backups()
             
             # Show save file info
             self.show_save_info()
@@ -126,6 +324,8 @@ class SaveEditorCLI:
         if not self.editor:
             return
             
+        from rich.table import Table
+        
         info = self.editor.get_save_info()
         
         table = Table(title="Save Game Information", border_style="green")
@@ -153,7 +353,7 @@ class SaveEditorCLI:
     def show_main_menu(self) -> str:
         """Show the main menu and return selected action."""
         # Show changes indicator
-        if self.editor and self.editor.has_changes():
+        if self.editor and self._has_changes():
             changes_text = "[yellow]⚠ You have unsaved changes[/yellow]"
         else:
             changes_text = "[green]✓ No unsaved changes[/green]"
@@ -161,19 +361,7 @@ class SaveEditorCLI:
         self.console.print(changes_text)
         self.console.print()
         
-        choices = [
-            {"name": "📊 Show Status", "value": "status"},
-            {"name": "💰 Edit Money/Funds", "value": "money"},
-            {"name": "🔬 Manage Research", "value": "research"},
-            {"name": "👤 Edit Soldiers/Agents", "value": "soldiers"},
-            {"name": "🏗️ Manage Facilities", "value": "facilities"},
-            {"name": "⚙️ Manage Production", "value": "production"},
-            {"name": "📦 Edit Inventory", "value": "inventory"},
-            {"name": "🗂️ Backup Management", "value": "backup"},
-            {"name": "💾 Save Changes", "value": "save"},
-            {"name": "↺ Reset All Changes", "value": "reset"},
-            {"name": "❌ Exit", "value": "exit"},
-        ]
+        choices = list(_MAIN_MENU_CHOICES)
         
         return inquirer.select(
             message="Select an option:",
@@ -186,43 +374,26 @@ class SaveEditorCLI:
             return
         
         status = self.editor.get_quick_status()
+        panels = self._get_status_panels()
         
-        # Money panel
-        money_text = f"Current: ${status['funds']['current']:,}\nPrevious: ${status['funds']['previous']:,}"
-        money_panel = Panel(money_text, title="💰 Funds", border_style="green")
-        
-        # Research panel
-        research_text = f"Active: {status['research']['active']}\nCompleted: {status['research']['completed']}"
-        research_panel = Panel(research_text, title="🔬 Research", border_style="blue")
-        
-        # Facilities panel
-        facilities_text = f"Building: {status['facilities']['building']}\nCompleted: {status['facilities']['completed']}"
-        facilities_panel = Panel(facilities_text, title="🏗️ Facilities", border_style="yellow")
-        
-        # Production panel
-        production_text = f"Active: {status['production']['active']}\nTotal: {status['production']['total']}"
-        production_panel = Panel(production_text, title="⚙️ Production", border_style="magenta")
-        
-        # Bases panel
-        bases_text = f"Total Bases: {status['bases']['total']}\n" + "\n".join(status['bases']['names'])
-        bases_panel = Panel(bases_text, title="🏠 Bases", border_style="cyan")
-        
-        # Soldiers panel
-        soldiers_text = f"Total Soldiers: {status['soldiers']['total']}"
-        soldiers_panel = Panel(soldiers_text, title="👤 Soldiers", border_style="red")
+        # Only the panel bodies change between views
+        panels['funds'].renderable = f"Current: ${status['funds']['current']:,}\nPrevious: ${status['funds']['previous']:,}"
+        panels['research'].renderable = f"Active: {status['research']['active']}\nCompleted: {status['research']['completed']}"
+        panels['facilities'].renderable = f"Building: {status['facilities']['building']}\nCompleted: {status['facilities']['completed']}"
+        panels['production'].renderable = f"Active: {status['production']['active']}\nTotal: {status['production']['total']}"
+        panels['bases'].renderable = f"Total Bases: {status['bases']['total']}\n" + "\n".join(status['bases']['names'])
+        panels['soldiers'].renderable = f"Total Soldiers: {status['soldiers']['total']}"
         
         self.console.print()
         
         # Print panels in a grid-like fashion
-        from rich.columns import Columns
-        self.console.print(Columns([money_panel, research_panel]))
-        self.console.print(Columns([facilities_panel, production_panel]))
-        self.console.print(Columns([bases_panel, soldiers_panel]))
+        for row in self._status_rows:
+            self.console.print(row)
         
         self.console.print()
         
         # Wait for user input
-        inquirer.confirm("Press Enter to continue...").execute()
+        pause()
     
     def handle_money_menu(self):
         """Handle money editing menu."""
@@ -235,11 +406,7 @@ class SaveEditorCLI:
         rprint(f"[blue]Previous Month: ${previous:,}[/blue]")
         rprint()
         
-        choices = [
-            {"name": "Set new amount", "value": "set"},
-            {"name": "Add funds", "value": "add"},
-            {"name": "Back to main menu", "value": "back"},
-        ]
+        choices = list(_MONEY_MENU_CHOICES)
         
         action = inquirer.select(
             message="What would you like to do?",
@@ -275,19 +442,18 @@ class SaveEditorCLI:
             return
         
         research_manager = self.editor.research_manager
-        active_projects = research_manager.get_active_research_projects()
+        active_count = research_manager.count_active()
         
-        if not active_projects:
+        if not active_count:
             rprint("[yellow]No active research projects found.[/yellow]")
             return
         
-        rprint(f"[blue]Found {len(active_projects)} active research project(s)[/blue]")
+        rprint(f"[blue]Found {active_count} active research project(s)[/blue]")
         rprint()
         
         choices = [
-            {"name": f"Complete all research projects ({len(active_projects)} projects)", "value": "complete_all"},
-            {"name": "Complete individual project", "value": "complete_individual"},
-            {"name": "Back to main menu", "value": "back"},
+            {"name": f"Complete all research projects ({active_count} projects)", "value": "complete_all"},
+            *_RESEARCH_MENU_TAIL,
         ]
         
         action = inquirer.select(
@@ -297,7 +463,7 @@ class SaveEditorCLI:
         
         if action == "complete_all":
             confirm = inquirer.confirm(
-                f"Complete all {len(active_projects)} research projects?",
+                f"Complete all {active_count} research projects?",
                 default=False
             ).execute()
             
@@ -307,10 +473,11 @@ class SaveEditorCLI:
         
         elif action == "complete_individual":
             # Show list of projects
+            active_projects = research_manager.get_active_research_projects()
             project_choices = [
                 {"name": f"{proj.display_name} ({proj.progress_percentage:.1f}% complete)", "value": proj}
                 for proj in active_projects
-            ] + [{"name": "Back", "value": "back"}]
+            ] + [_BACK_CHOICE]
             
             selected_project = inquirer.select(
                 message="Select project to complete:",
@@ -338,9 +505,7 @@ class SaveEditorCLI:
         
         choices = [
             {"name": f"Set all soldiers to max stats ({len(soldiers)} soldiers)", "value": "max_all"},
-            {"name": "Set custom max value for all soldiers", "value": "custom_all"},
-            {"name": "Edit individual soldier", "value": "individual"},
-            {"name": "Back to main menu", "value": "back"},
+            *_SOLDIERS_MENU_TAIL,
         ]
         
         action = inquirer.select(
@@ -359,13 +524,17 @@ class SaveEditorCLI:
                 rprint(f"[green]✓ Set {modified_count} soldiers to max stats[/green]")
         
         elif action == "custom_all":
+            # An empty entry is rejected inline instead of failing after the prompt
             max_value = inquirer.number(
                 message="Enter maximum stat value (1-255):",
                 min_allowed=1,
                 max_allowed=255,
-                default=100
+                default=100,
+                validate=lambda value: value != "",
+                invalid_message="Enter a value between 1 and 255"
             ).execute()
             
+            # Editing every soldier at once keeps its explicit confirmation
             confirm = inquirer.confirm(
                 f"Set all {len(soldiers)} soldiers to stat value {int(max_value)}?",
                 default=False
@@ -380,7 +549,7 @@ class SaveEditorCLI:
             soldier_choices = [
                 {"name": f"{soldier.name} - Rank {soldier.rank} - {soldier.missions} missions", "value": soldier}
                 for soldier in soldiers
-            ] + [{"name": "Back", "value": "back"}]
+            ] + [_BACK_CHOICE]
             
             selected_soldier = inquirer.select(
                 message="Select soldier to edit:",
@@ -392,6 +561,8 @@ class SaveEditorCLI:
     
     def handle_individual_soldier_edit(self, soldier):
         """Handle editing individual soldier stats."""
+        from rich.table import Table
+        
         soldier_manager = self.editor.soldier_manager
         
         # Show current stats
@@ -402,21 +573,14 @@ class SaveEditorCLI:
         table.add_column("Stat", style="cyan")
         table.add_column("Value", style="white")
         
-        from .game_editors.soldier_manager import Soldier
-        for stat_name in Soldier.STATS:
-            current_value = soldier.get_stat(stat_name)
-            formatted_stat = stat_name.replace('psi', 'Psi ').replace('Strength', ' Strength').replace('Skill', ' Skill')
-            table.add_row(formatted_stat.title(), str(current_value))
+        soldier_stats = _get_soldier_stats()
+        for stat_name, stat_label in soldier_stats:
+            table.add_row(stat_label, str(soldier.get_stat(stat_name)))
         
         self.console.print(table)
         rprint()
         
-        choices = [
-            {"name": "Set all stats to maximum (100)", "value": "max"},
-            {"name": "Set all stats to custom value", "value": "custom"},
-            {"name": "Edit individual stat", "value": "individual_stat"},
-            {"name": "Back", "value": "back"},
-        ]
+        choices = list(_SOLDIER_EDIT_CHOICES)
         
         action = inquirer.select(
             message="What would you like to do?",
@@ -439,8 +603,7 @@ class SaveEditorCLI:
             rprint(f"[green]✓ Set all stats to {int(value)} for {soldier.name}[/green]")
         
         elif action == "individual_stat":
-            from .game_editors.soldier_manager import Soldier
-            stat_choices = [{"name": name.title(), "value": name} for name in Soldier.STATS] + [{"name": "Back", "value": "back"}]
+            stat_choices = [{"name": name.title(), "value": name} for name, _ in soldier_stats] + [_BACK_CHOICE]
             
             selected_stat = inquirer.select(
                 message="Select stat to edit:",
@@ -475,14 +638,16 @@ class SaveEditorCLI:
         rprint()
         
         # Show facilities under construction
+        from rich.table import Table
+        
         table = Table(title="Facilities Under Construction")
         table.add_column("Base", style="cyan")
         table.add_column("Facility", style="white")
         table.add_column("Time Remaining", style="yellow")
         
-        base_names = facility_manager.get_base_names()
+        base_name_by_index = dict(enumerate(facility_manager.get_base_names()))
         for facility in under_construction:
-            base_name = base_names[facility.base_index] if facility.base_index < len(base_names) else f"Base {facility.base_index + 1}"
+            base_name = base_name_by_index.get(facility.base_index, f"Base {facility.base_index + 1}")
             table.add_row(base_name, facility.display_name, f"{facility.build_time_remaining} hours")
         
         self.console.print(table)
@@ -490,8 +655,7 @@ class SaveEditorCLI:
         
         choices = [
             {"name": f"Complete all facility construction ({len(under_construction)} facilities)", "value": "complete_all"},
-            {"name": "Complete individual facility", "value": "complete_individual"},
-            {"name": "Back to main menu", "value": "back"},
+            *_FACILITIES_MENU_TAIL,
         ]
         
         action = inquirer.select(
@@ -510,11 +674,10 @@ class SaveEditorCLI:
                 rprint(f"[green]✓ Completed construction of {completed_count} facilities[/green]")
         
         elif action == "complete_individual":
-            base_names = facility_manager.get_base_names()
             facility_choices = [
-                {"name": f"{base_names[f.base_index]}: {f.display_name} ({f.build_time_remaining}h)", "value": f}
+                {"name": f"{base_name_by_index.get(f.base_index, f'Base {f.base_index + 1}')}: {f.display_name} ({f.build_time_remaining}h)", "value": f}
                 for f in under_construction
-            ] + [{"name": "Back", "value": "back"}]
+            ] + [_BACK_CHOICE]
             
             selected_facility = inquirer.select(
                 message="Select facility to complete:",
@@ -531,19 +694,18 @@ class SaveEditorCLI:
             return
         
         production_manager = self.editor.production_manager
-        active_items = production_manager.get_active_production_items()
+        active_count = production_manager.count_active()
         
-        if not active_items:
+        if not active_count:
             rprint("[yellow]No active production items.[/yellow]")
             return
         
-        rprint(f"[blue]Found {len(active_items)} active production item(s)[/blue]")
+        rprint(f"[blue]Found {active_count} active production item(s)[/blue]")
         rprint()
         
         choices = [
-            {"name": f"Complete all production items ({len(active_items)} items)", "value": "complete_all"},
-            {"name": "Complete individual item", "value": "complete_individual"},
-            {"name": "Back to main menu", "value": "back"},
+            {"name": f"Complete all production items ({active_count} items)", "value": "complete_all"},
+            *_PRODUCTION_MENU_TAIL,
         ]
         
         action = inquirer.select(
@@ -553,7 +715,7 @@ class SaveEditorCLI:
         
         if action == "complete_all":
             confirm = inquirer.confirm(
-                f"Complete production of all {len(active_items)} items?",
+                f"Complete production of all {active_count} items?",
                 default=False
             ).execute()
             
@@ -562,11 +724,12 @@ class SaveEditorCLI:
                 rprint(f"[green]✓ Completed production of {completed_count} items[/green]")
         
         elif action == "complete_individual":
-            base_names = production_manager.get_base_names()
+            active_items = production_manager.get_active_production_items()
+            base_name_by_index = dict(enumerate(production_manager.get_base_names()))
             item_choices = [
-                {"name": f"{base_names[item.base_index]}: {item.display_name} x{item.amount_to_produce} ({item.time_spent}h)", "value": item}
+                {"name": f"{base_name_by_index.get(item.base_index, f'Base {item.base_index + 1}')}: {item.display_name} x{item.amount_to_produce} ({item.time_spent}h)", "value": item}
                 for item in active_items
-            ] + [{"name": "Back", "value": "back"}]
+            ] + [_BACK_CHOICE]
             
             selected_item = inquirer.select(
                 message="Select item to complete:",
@@ -613,28 +776,25 @@ class SaveEditorCLI:
         rprint(f"[blue]{base_names[selected_base]} Inventory ({len(inventory)} item types):[/blue]")
         rprint()
         
+        from rich.table import Table
+        
         table = Table(title=f"{base_names[selected_base]} Inventory")
         table.add_column("Item", style="cyan")
         table.add_column("Quantity", style="white")
         
-        # Sort by quantity (descending)
-        sorted_items = sorted(inventory.items(), key=lambda x: x[1], reverse=True)
+        # Show the top 20 items by quantity without sorting the whole inventory
+        top_items = heapq.nlargest(20, inventory.items(), key=itemgetter(1))
         
-        for item_name, quantity in sorted_items[:20]:  # Show top 20 items
-            display_name = inventory_manager._format_item_name(item_name)
-            table.add_row(display_name, f"{quantity:,}")
+        for item_name, quantity in top_items:
+            table.add_row(inventory_manager._format_item_name(item_name), f"{quantity:,}")
         
-        if len(sorted_items) > 20:
-            table.add_row("...", f"... and {len(sorted_items) - 20} more items")
+        if len(inventory) > 20:
+            table.add_row("...", f"... and {len(inventory) - 20} more items")
         
         self.console.print(table)
         rprint()
         
-        choices = [
-            {"name": "Edit item quantity", "value": "edit_quantity"},
-            {"name": "Search for item", "value": "search"},
-            {"name": "Back", "value": "back"},
-        ]
+        choices = list(_INVENTORY_MENU_CHOICES)
         
         action = inquirer.select(
             message="What would you like to do?",
@@ -642,11 +802,12 @@ class SaveEditorCLI:
         ).execute()
         
         if action == "edit_quantity":
-            # Select item to edit
+            # Select item to edit (full list, sorted by quantity descending)
+            sorted_items = sorted(inventory.items(), key=itemgetter(1), reverse=True)
             item_choices = [
                 {"name": f"{inventory_manager._format_item_name(name)} ({qty:,})", "value": name}
                 for name, qty in sorted_items
-            ] + [{"name": "Back", "value": "back"}]
+            ] + [_BACK_CHOICE]
             
             selected_item = inquirer.select(
                 message="Select item to edit:",
@@ -674,15 +835,16 @@ class SaveEditorCLI:
                 invalid_message="Search term must be at least 2 characters"
             ).execute()
             
-            matching_items = inventory_manager.search_items(search_term)
+            # Print matches as they are found rather than collecting them first
+            match_count = 0
+            for item_name, total_qty in inventory_manager.isearch_items(search_term):
+                match_count += 1
+                display_name = inventory_manager._format_item_name(item_name)
+                base_qty = inventory_manager.get_item_quantity(selected_base, item_name)
+                rprint(f"  {display_name}: {base_qty:,} (total across all bases: {total_qty:,})")
             
-            if matching_items:
-                rprint(f"[green]Found {len(matching_items)} matching item(s):[/green]")
-                
-                for item_name, total_qty in matching_items.items():
-                    display_name = inventory_manager._format_item_name(item_name)
-                    base_qty = inventory_manager.get_item_quantity(selected_base, item_name)
-                    rprint(f"  {display_name}: {base_qty:,} (total across all bases: {total_qty:,})")
+            if match_count:
+                rprint(f"[green]Found {match_count} matching item(s)[/green]")
             else:
                 rprint(f"[yellow]No items found matching '{search_term}'[/yellow]")
     
@@ -691,7 +853,7 @@ class SaveEditorCLI:
         if not self.editor:
             return
         
-        backups = self.editor.get_available_backups()
+        backups = self._get_backups()
         
         if not backups:
             rprint("[yellow]No backups available.[/yellow]")
@@ -703,33 +865,36 @@ class SaveEditorCLI:
             
             if create_backup:
                 backup_path = self.editor.create_backup()
+                self._refresh_backups()
                 rprint(f"[green]✓ Backup created: {Path(backup_path).name}[/green]")
             
             return
         
+        # Format each backup's size and timestamp once for the table and the restore picker
+        for backup in backups:
+            if 'size_mb' not in backup:
+                backup['created_str'] = datetime.fromtimestamp(backup['created']).strftime("%Y-%m-%d %H:%M:%S")
+                backup['size_mb'] = backup['size'] / 1048576
+        
         # Show available backups
+        from rich.table import Table
+        
         table = Table(title="Available Backups")
         table.add_column("Backup Name", style="cyan")
         table.add_column("Size", style="white")
         table.add_column("Created", style="yellow")
         
         for backup in backups:
-            size_mb = backup['size'] / 1024 / 1024
-            created_time = datetime.fromtimestamp(backup['created'])
             table.add_row(
                 backup['name'], 
-                f"{size_mb:.2f} MB",
-                created_time.strftime("%Y-%m-%d %H:%M:%S")
+                f"{backup['size_mb']:.2f} MB",
+                backup['created_str']
             )
         
         self.console.print(table)
         rprint()
         
-        choices = [
-            {"name": "Create new backup", "value": "create"},
-            {"name": "Restore from backup", "value": "restore"},
-            {"name": "Back to main menu", "value": "back"},
-        ]
+        choices = list(_BACKUP_MENU_CHOICES)
         
         action = inquirer.select(
             message="What would you like to do?",
@@ -738,13 +903,14 @@ class SaveEditorCLI:
         
         if action == "create":
             backup_path = self.editor.create_backup()
+            self._refresh_backups()
             rprint(f"[green]✓ Backup created: {Path(backup_path).name}[/green]")
         
         elif action == "restore":
             backup_choices = [
-                {"name": f"{backup['name']} ({datetime.fromtimestamp(backup['created']).strftime('%Y-%m-%d %H:%M:%S')})", "value": backup['path']}
+                {"name": f"{backup['name']} ({backup['created_str']})", "value": backup['path']}
                 for backup in backups
-            ] + [{"name": "Back", "value": "back"}]
+            ] + [_BACK_CHOICE]
             
             selected_backup = inquirer.select(
                 message="Select backup to restore:",
@@ -758,7 +924,10 @@ class SaveEditorCLI:
                 ).execute()
                 
                 if confirm:
-                    if self.editor.restore_backup(selected_backup):
+                    restored = self.editor.restore_backup(selected_backup)
+                    self._sync_saved_counter()
+                    self._refresh_backups()
+                    if restored:
                         rprint("[green]✓ Backup restored successfully[/green]")
                     else:
                         rprint("[red]✗ Failed to restore backup[/red]")
@@ -777,8 +946,10 @@ class SaveEditorCLI:
             
         success = self.editor.commit_changes(create_backup)
         if success:
+            self._sync_saved_counter()
             rprint("[green]✓ Changes saved successfully![/green]")
             if create_backup:
+                self._refresh_backups()
                 rprint("[green]✓ Backup created before saving[/green]")
         else:
             rprint("[red]✗ Failed to save changes[/red]")
@@ -790,7 +961,7 @@ class SaveEditorCLI:
         if not self.editor:
             return
         
-        if not self.editor.has_changes():
+        if not self._has_changes():
             rprint("[yellow]No changes to save.[/yellow]")
             return
         
@@ -822,7 +993,7 @@ class SaveEditorCLI:
         if not self.editor:
             return
         
-        if not self.editor.has_changes():
+        if not self._has_changes():
             rprint("[yellow]No changes to reset.[/yellow]")
             return
         
@@ -842,6 +1013,7 @@ class SaveEditorCLI:
         
         if confirm:
             self.editor.reset_all_changes()
+            self._sync_saved_counter()
             rprint("[green]✓ All changes reset to original values[/green]")
     
     def handle_exit(self) -> bool:
@@ -849,16 +1021,12 @@ class SaveEditorCLI:
         if not self.editor:
             return True
         
-        if self.editor.has_changes():
+        if self._has_changes():
             rprint("[yellow]You have unsaved changes![/yellow]")
             
             action = inquirer.select(
                 message="What would you like to do?",
-                choices=[
-                    {"name": "Save changes and exit", "value": "save"},
-                    {"name": "Exit without saving", "value": "discard"},
-                    {"name": "Cancel (don't exit)", "value": "cancel"},
-                ],
+                choices=list(_EXIT_CHOICES),
             ).execute()
             
             if action == "save":
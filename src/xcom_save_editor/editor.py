@@ -2,16 +2,67 @@
 Main OpenXCom save game editor class.
 Coordinates all managers and handles the editing workflow.
 """
-import copy
+import os
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import yaml
+
 from .utils.file_ops import SaveFileManager
-from .utils.validator import detailed_validate_save
+from .utils.validator import detailed_validate_save, validate_save_branches
 from .game_editors import (
     MoneyManager, ResearchManager, SoldierManager, 
     FacilityManager, ProductionManager, InventoryManager
 )
+from .game_editors.base_manager import _ATOMIC_TYPES, _MISSING, _fast_clone
+
+
+# Manager registry: class and the key prefix for its entries in get_all_changes_summary.
+# __init__ unpacks the managers into the *_manager attributes in this order.
+_MANAGER_REGISTRY = (
+    (MoneyManager, 'Money_'),
+    (ResearchManager, 'Research_'),
+    (SoldierManager, 'Soldiers_'),
+    (FacilityManager, 'Facilities_'),
+    (ProductionManager, 'Production_'),
+    (InventoryManager, 'Inventory_'),
+)
+
+
+def _snapshot(branch: Any) -> Any:
+    """Copy a save branch; flat lists/dicts of scalars only need a shallow copy."""
+    cls = type(branch)
+    if cls is list and all(type(value) in _ATOMIC_TYPES for value in branch):
+        return branch[:]
+    if cls is dict and all(type(value) in _ATOMIC_TYPES for value in branch.values()):
+        return dict(branch)
+    return _fast_clone(branch)
+
+
+def _intern_strings(obj: Any) -> Any:
+    """
+    Intern the save tree's repeated strings in place and return it.
+    
+    Mapping keys and ``STR_*`` IDs repeat thousands of times in a late-game save;
+    interning makes each one a single shared object. Containers are rewritten
+    rather than copied, so the tree is never held twice while loading.
+    """
+    cls = type(obj)
+    if cls is dict:
+        # Re-inserting is the only way to swap a key object; order is preserved
+        items = list(obj.items())
+        obj.clear()
+        for key, value in items:
+            obj[sys.intern(key) if type(key) is str else key] = _intern_strings(value)
+        return obj
+    if cls is list:
+        for index, value in enumerate(obj):
+            obj[index] = _intern_strings(value)
+        return obj
+    if cls is str and obj.startswith('STR_'):
+        return sys.intern(obj)
+    return obj
 
 
 class OpenXComSaveEditor:
@@ -28,30 +79,88 @@ class OpenXComSaveEditor:
         self.file_manager = SaveFileManager(str(self.save_file_path))
         
         # Load the save data
-        self.save_data = self.file_manager.load_save_file()
-        self.original_save_data = copy.deepcopy(self.save_data)
+        self.save_data = _intern_strings(self.file_manager.load_save_file())
         
-        # Initialize managers
-        self.money_manager = MoneyManager(self.save_data)
-        self.research_manager = ResearchManager(self.save_data)
-        self.soldier_manager = SoldierManager(self.save_data)
-        self.facility_manager = FacilityManager(self.save_data)
-        self.production_manager = ProductionManager(self.save_data)
-        self.inventory_manager = InventoryManager(self.save_data)
+        # Pristine copies of top-level branches, taken the first time a manager
+        # is about to modify one; untouched branches are never copied
+        self._original_snapshots: Dict[str, Any] = {}
+        
+        # Initialize managers; their originals are read through the snapshots, so
+        # nothing is copied until a branch is first written
+        self._managers = tuple(manager_cls(self.save_data, self.snapshot,
+                                           original_view=self._original_view)
+                               for manager_cls, _ in _MANAGER_REGISTRY)
+        (self.money_manager, self.research_manager, self.soldier_manager,
+         self.facility_manager, self.production_manager, self.inventory_manager) = self._managers
+        self._named_managers = tuple((prefix, manager) for (_, prefix), manager
+                                     in zip(_MANAGER_REGISTRY, self._managers))
         
         # Track if backup was created
         self.backup_created = False
         self.backup_path = None
+        
+        # Bumped when reset/restore replaces the data without a manager edit
+        self._mutation_base = 0
+        
+        # get_quick_status / get_save_info results and the state they were built from;
+        # _file_version moves whenever the save file or its backups change on disk
+        self._file_version = 0
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_version = -1
+        self._save_info_cache: Optional[Dict[str, Any]] = None
+        self._save_info_version: Optional[tuple] = None
+        self._summary_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._summary_version: Optional[tuple] = None
+        self._has_changes_cache = False
+        self._has_changes_version: Optional[tuple] = None
+        
+        # get_available_backups result, valid while the backup directory mtime is unchanged
+        self._backups_cache: List[Dict[str, Any]] = []
+        self._backups_dir_mtime: Optional[int] = None
+        
+        # Base names change only on rename/reset/restore; see invalidate_base_names()
+        self._base_names_cache: Optional[List[str]] = None
+    
+    def snapshot(self, key: str, subtree: Any) -> None:
+        """
+        Keep a copy of a top-level branch before its first modification.
+        
+        Args:
+            key: Top-level key in the save data (e.g. 'bases')
+            subtree: Current value of that branch, or _MISSING if absent
+        """
+        if key not in self._original_snapshots:
+            self._original_snapshots[key] = subtree if subtree is _MISSING else _snapshot(subtree)
+    
+    @property
+    def original_save_data(self) -> Dict[str, Any]:
+        """Save data as last loaded or committed (untouched branches are shared)."""
+        return self._original_view()
+    
+    def _original_view(self) -> Dict[str, Any]:
+        """Build ``original_save_data``; handed to the managers as their original."""
+        original = dict(self.save_data)
+        for key, subtree in self._original_snapshots.items():
+            if subtree is _MISSING:
+                original.pop(key, None)
+            else:
+                original[key] = subtree
+        return original
     
     def create_backup(self) -> str:
         """Create a backup of the save file."""
         if not self.backup_created:
             self.backup_path = self.file_manager.create_backup()
             self.backup_created = True
+            self._file_version += 1
         return self.backup_path
     
     def get_save_info(self) -> Dict[str, Any]:
-        """Get information about the current save file."""
+        """Get information about the current save file (cached until the save changes)."""
+        version = (self.mutation_counter, self._file_version)
+        if self._save_info_version == version:
+            return self._save_info_cache
+        
         file_info = self.file_manager.get_file_info()
         
         # Get header data from first YAML document, fall back to main save data
@@ -69,66 +178,94 @@ class OpenXComSaveEditor:
         }
         
         # Add base information
-        bases = self.save_data.get('bases', [])
-        save_info['total_bases'] = len(bases)
-        save_info['base_names'] = []
-        
-        for i, base in enumerate(bases):
-            if isinstance(base, dict):
-                name = base.get('name', f'Base {i + 1}')
-                save_info['base_names'].append(name)
+        save_info['total_bases'] = len(self.save_data.get('bases', []))
+        save_info['base_names'] = self._base_names()
         
+        self._save_info_cache = save_info
+        self._save_info_version = version
         return save_info
     
+    def _base_names(self) -> List[str]:
+        """Names of all bases, built on first use and then reused."""
+        if self._base_names_cache is None:
+            self._base_names_cache = [
+                base.get('name', f'Base {i + 1}') if isinstance(base, dict) else f'Base {i + 1}'
+                for i, base in enumerate(self.save_data.get('bases', []))
+            ]
+        return self._base_names_cache
+    
+    def invalidate_base_names(self) -> None:
+        """Drop the cached base names; call after renaming or replacing bases."""
+        self._base_names_cache = None
+    
     def has_changes(self) -> bool:
-        """Check if any changes have been made."""
-        return (self.money_manager.has_changes() or
-                self.research_manager.has_changes() or
-                self.soldier_manager.has_changes() or
-                self.facility_manager.has_changes() or
-                self.production_manager.has_changes() or
-                self.inventory_manager.has_changes())
+        """Check if the save differs from its last loaded or committed state (cached until the next edit or save)."""
+        version = (self.mutation_counter, self._file_version)
+        if self._has_changes_version == version:
+            return self._has_changes_cache
+        
+        # Only snapshotted branches can have been written; stop at the first that differs
+        save_data = self.save_data
+        changed = any(save_data.get(key, _MISSING) != subtree
+                      for key, subtree in self._original_snapshots.items())
+        self._has_changes_cache, self._has_changes_version = changed, version
+        return changed
+    
+    @property
+    def mutation_counter(self) -> int:
+        """Monotonic edit counter; changes whenever the in-memory save changes."""
+        return self._mutation_base + sum(manager.mutation_count for manager in self._managers)
     
     def get_all_changes_summary(self) -> Dict[str, Dict[str, Any]]:
-        """Get a comprehensive summary of all changes made."""
+        """Get a comprehensive summary of all changes made (cached until the next edit or save)."""
+        version = (self.mutation_counter, self._file_version)
+        if self._summary_version == version:
+            return self._summary_cache
+        
         all_changes = {
             'modified': {},
             'added': {},
             'removed': {}
         }
         
-        # Collect changes from all managers
-        managers = [
-            ('Money', self.money_manager),
-            ('Research', self.research_manager),
-            ('Soldiers', self.soldier_manager),
-            ('Facilities', self.facility_manager),
-            ('Production', self.production_manager),
-            ('Inventory', self.inventory_manager)
-        ]
+        if not self.has_changes():
+            self._summary_cache, self._summary_version = all_changes, version
+            return all_changes
         
-        for manager_name, manager in managers:
+        # Collect changes from all managers
+        for prefix, manager in self._named_managers:
+            if not manager.has_changes():
+                continue
             changes = manager.get_changes_summary()
             
-            for change_type in ['modified', 'added', 'removed']:
-                if changes[change_type]:
-                    for key, value in changes[change_type].items():
-                        all_changes[change_type][f"{manager_name}_{key}"] = value
+            for change_type, entries in changes.items():
+                if entries:
+                    target = all_changes[change_type]
+                    for key, value in entries.items():
+                        target[prefix + key] = value
         
+        self._summary_cache, self._summary_version = all_changes, version
         return all_changes
     
     def reset_all_changes(self) -> None:
         """Reset all changes to original state."""
-        # Reset the main save data
-        self.save_data = copy.deepcopy(self.original_save_data)
-        
-        # Reinitialize all managers with the reset data
-        self.money_manager = MoneyManager(self.save_data)
-        self.research_manager = ResearchManager(self.save_data)
-        self.soldier_manager = SoldierManager(self.save_data)
-        self.facility_manager = FacilityManager(self.save_data)
-        self.production_manager = ProductionManager(self.save_data)
-        self.inventory_manager = InventoryManager(self.save_data)
+        # Put the snapshotted branches back; untouched branches were never modified
+        self._mutation_base += 1
+        for key, subtree in self._original_snapshots.items():
+            if subtree is _MISSING:
+                self.save_data.pop(key, None)
+            else:
+                self.save_data[key] = subtree
+        self._original_snapshots.clear()
+        
+        self.invalidate_base_names()
+        self._rebind_managers()
+    
+    def _rebind_managers(self) -> None:
+        """Point every manager at the current save data as its new baseline."""
+        # Snapshots were just cleared, so the original view already equals save_data
+        for manager in self._managers:
+            manager.rebind(self.save_data)
     
     def validate_save_data(self) -> tuple[bool, List[str], List[str]]:
         """Validate the current save data."""
@@ -144,35 +281,53 @@ class OpenXComSaveEditor:
         Returns:
             True if successful, False otherwise
         """
+        # Create backup if requested
+        if create_backup and not self._do_backup():
+            return False
+        
+        if not self._do_validate():
+            return False
+        
+        if not self._do_write():
+            return False
+        
+        # Only reached after a successful write, so a failed save leaves the
+        # snapshots and manager baselines in place for the next attempt
+        self._do_snapshot_original()
+        return True
+    
+    def _do_validate(self) -> bool:
+        """Validate the branches edited since load/commit, reporting any errors."""
+        is_valid, errors, warnings = validate_save_branches(self.save_data, self._original_snapshots)
+        if not is_valid:
+            print(f"Error saving file: Save validation failed: {', '.join(errors)}")
+        return is_valid
+    
+    def _do_backup(self) -> bool:
+        """Back up the save file before the first write, reporting I/O errors."""
         try:
-            # Create backup if requested
-            if create_backup:
-                self.create_backup()
-            
-            # Validate before saving
-            is_valid, errors, warnings = self.validate_save_data()
-            if not is_valid:
-                raise ValueError(f"Save validation failed: {', '.join(errors)}")
-            
-            # Save the file
-            self.file_manager.save_file(self.save_data)
-            
-            # Update original data to current state
-            self.original_save_data = copy.deepcopy(self.save_data)
-            
-            # Reset change tracking in all managers
-            self.money_manager.update_original_data(self.save_data)
-            self.research_manager.update_original_data(self.save_data)
-            self.soldier_manager.update_original_data(self.save_data)
-            self.facility_manager.update_original_data(self.save_data)
-            self.production_manager.update_original_data(self.save_data)
-            self.inventory_manager.update_original_data(self.save_data)
-            
-            return True
-            
-        except Exception as e:
+            self.create_backup()
+        except OSError as e:
+            print(f"Error saving file: could not create backup: {e}")
+            return False
+        return True
+    
+    def _do_write(self) -> bool:
+        """Write the save data to disk, reporting I/O and serialisation errors."""
+        try:
+            # Branches never written since load/commit keep their YAML text
+            self.file_manager.save_file(self.save_data, changed_keys=self._original_snapshots)
+        except (OSError, yaml.YAMLError, ValueError) as e:
             print(f"Error saving file: {e}")
             return False
+        self._file_version += 1
+        return True
+    
+    def _do_snapshot_original(self) -> None:
+        """Make the just-saved state the new original for change tracking."""
+        # Snapshots are taken afresh on next edit
+        self._original_snapshots.clear()
+        self._rebind_managers()
     
     def restore_backup(self, backup_path: Optional[str] = None) -> bool:
         """
@@ -184,53 +339,60 @@ class OpenXComSaveEditor:
         Returns:
             True if successful, False otherwise
         """
+        if backup_path is None:
+            # Use the most recent backup
+            backups = self.file_manager.list_backups()
+            if not backups:
+                print("No backups available")
+                return False
+            backup_path = backups[0]  # Most recent
+        
+        # Restore the backup
         try:
-            if backup_path is None:
-                # Use the most recent backup
-                backups = self.file_manager.list_backups()
-                if not backups:
-                    print("No backups available")
-                    return False
-                backup_path = backups[0]  # Most recent
-            
-            # Restore the backup
             self.file_manager.restore_backup(backup_path)
-            
-            # Reload the data
-            self.save_data = self.file_manager.load_save_file()
-            self.original_save_data = copy.deepcopy(self.save_data)
-            
-            # Reinitialize managers
-            self.money_manager = MoneyManager(self.save_data)
-            self.research_manager = ResearchManager(self.save_data)
-            self.soldier_manager = SoldierManager(self.save_data)
-            self.facility_manager = FacilityManager(self.save_data)
-            self.production_manager = ProductionManager(self.save_data)
-            self.inventory_manager = InventoryManager(self.save_data)
-            
-            return True
-            
-        except Exception as e:
+        except OSError as e:
             print(f"Error restoring backup: {e}")
             return False
+        self._file_version += 1
+        
+        # Reload the data
+        try:
+            save_data = self.file_manager.load_save_file()
+        except (OSError, yaml.YAMLError, ValueError) as e:
+            print(f"Error restoring backup: could not load restored save: {e}")
+            return False
+        
+        self._mutation_base += 1
+        self.save_data = _intern_strings(save_data)
+        self._original_snapshots.clear()
+        
+        self.invalidate_base_names()
+        self._rebind_managers()
+        
+        return True
     
     def get_available_backups(self) -> List[Dict[str, Any]]:
-        """Get information about available backup files."""
-        backup_paths = self.file_manager.list_backups()
-        backups = []
-        
-        for backup_path in backup_paths:
-            backup_file = Path(backup_path)
-            if backup_file.exists():
-                stat = backup_file.stat()
-                backups.append({
-                    'path': backup_path,
-                    'name': backup_file.name,
-                    'size': stat.st_size,
-                    'created': stat.st_mtime,
-                    'created_str': backup_file.stat().st_mtime  # Will be formatted in CLI
-                })
+        """Get information about available backup files (cached while the backup directory is unchanged)."""
+        try:
+            dir_mtime = os.stat(self.file_manager.backup_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None and dir_mtime == self._backups_dir_mtime:
+            return self._backups_cache
+        
+        backups = [
+            {
+                'path': backup_path,
+                'name': os.path.basename(backup_path),
+                'size': size,
+                'created': mtime,
+                'created_str': mtime  # Will be formatted in CLI
+            }
+            for backup_path, size, mtime in self.file_manager.list_backups_with_stat()
+        ]
         
+        self._backups_cache = backups
+        self._backups_dir_mtime = dir_mtime
         return backups
     
     # Convenience methods for common operations
@@ -256,7 +418,11 @@ class OpenXComSaveEditor:
         self.money_manager.set_current_month_funds(amount)
     
     def get_quick_status(self) -> Dict[str, Any]:
-        """Get a quick overview of the save game status."""
+        """Get a quick overview of the save game status (cached until the next edit)."""
+        version = self.mutation_counter
+        if self._status_version == version:
+            return self._status_cache
+        
         money = self.money_manager.get_funds_display()
         
         research_summary = self.research_manager.get_research_summary()
@@ -264,7 +430,7 @@ class OpenXComSaveEditor:
         production_summary = self.production_manager.get_production_summary()
         soldier_summary = self.soldier_manager.get_soldier_summary()
         
-        return {
+        self._status_cache = {
             'funds': {
                 'current': money[0],
                 'previous': money[1]
@@ -286,6 +452,8 @@ class OpenXComSaveEditor:
             },
             'bases': {
                 'total': len(self.save_data.get('bases', [])),
-                'names': [base.get('name', f'Base {i+1}') for i, base in enumerate(self.save_data.get('bases', []))]
+                'names': self._base_names()
             }
-        }
\ No newline at end of file
+        }
+        self._status_version = version
+        return self._status_cache
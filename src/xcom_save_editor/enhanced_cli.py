@@ -4,28 +4,128 @@ Enhanced CLI interface with improved theming, navigation, and keyboard shortcuts
 
 import os
 import sys
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import rich_click as click
-from InquirerPy import inquirer
-from rich.console import Console
 
-from .editor import OpenXComSaveEditor
-from .cli import SaveEditorCLI  # Import original for compatibility
-from .ui import UIRenderer, get_current_theme, set_theme, get_available_themes
-from .ui.widgets import get_shortcut_manager
+# cli.py defers InquirerPy and the editor itself, so these names are cheap;
+# the Rich renderer and the editor are imported where they are first needed
+from .cli import SaveEditorCLI, inquirer, pause  # Import original for compatibility
+from .cli import _BACK_CHOICE, _EXIT_CHOICES, _MONEY_MENU_CHOICES, _RESEARCH_MENU_TAIL, _validate_sav_path
+from .ui.theme import get_current_theme, set_theme, get_available_themes
+
+if TYPE_CHECKING:
+    from .editor import OpenXComSaveEditor
+
+
+# Static main menu data, built once at import; each prompt gets a fresh list()
+_MAIN_MENU_CHOICES = (
+    {"name": "[S] 📊 Show Status", "value": "status"},
+    {"name": "[M] 💰 Edit Money/Funds", "value": "money"},
+    {"name": "[R] 🔬 Manage Research", "value": "research"},
+    {"name": "[A] 👤 Edit Soldiers/Agents", "value": "soldiers"},
+    {"name": "[F] 🏗️ Manage Facilities", "value": "facilities"},
+    {"name": "[P] ⚙️ Manage Production", "value": "production"},
+    {"name": "[I] 📦 Edit Inventory", "value": "inventory"},
+    {"name": "[B] 🗂️ Backup Management", "value": "backup"},
+    {"name": "[T] 🎨 Change Theme", "value": "theme"},
+    {"name": "💾 Save Changes", "value": "save"},
+    {"name": "↺ Reset All Changes", "value": "reset"},
+    {"name": "[H] ❓ Help", "value": "help"},
+    {"name": "[Q] ❌ Exit", "value": "exit"},
+)
+
+_MAIN_MENU_SHORTCUTS = {
+    's': 'status', 'm': 'money', 'r': 'research', 'a': 'soldiers',
+    'f': 'facilities', 'p': 'production', 'i': 'inventory', 
+    'b': 'backup', 't': 'theme', 'h': 'help', 'q': 'exit'
+}
+
+# Labels shown in the main menu footer
+_MAIN_MENU_FOOTER = {
+    "s": "Status", "m": "Money", "r": "Research", "a": "Soldiers", 
+    "f": "Facilities", "p": "Production", "i": "Inventory",
+    "t": "Theme", "h": "Help", "q": "Quit"
+}
+
+
+_HELP_TEXT = """
+[bold blue]OpenXCom Save Editor v2.0[/bold blue]
+
+This enhanced version includes:
+• Multiple theme support (default, dark, light, cyberpunk)
+• Improved navigation with breadcrumbs
+• Consistent styling and better information display
+• Enhanced status dashboard
+
+[bold yellow]Main Features:[/bold yellow]
+• Edit funds and resources
+• Complete research projects instantly
+• Modify soldier stats and abilities
+• Manage base facilities and production
+• Comprehensive backup system
+
+[bold green]Keyboard Shortcuts:[/bold green]
+• s - Status dashboard
+• m - Money management
+• r - Research management
+• a - Soldier (agents) management
+• f - Facilities management
+• p - Production management
+• i - Inventory management
+• t - Theme selection
+• h - This help screen
+• q - Quit application
+
+[bold red]Important Notes:[/bold red]
+• Always backup your saves before editing
+• This editor is designed for OpenXCom Extended + X-Com Files mod
+• Changes are not saved until you explicitly save them
+        """
+
+# Placeholder dashboard shown after a theme change
+_THEME_PREVIEW_STATUS = {
+    "Sample": {"Item 1": 100, "Item 2": "Active"},
+    "Preview": {"Colors": "Updated", "Style": "New Theme"}
+}
 
 
 class EnhancedSaveEditorCLI:
     """Enhanced CLI with improved theming and navigation."""
     
     def __init__(self):
+        from rich.console import Console
+        from .ui.renderer import UIRenderer
+        from .ui.widgets import get_shortcut_manager
+        
         self.console = Console()
         self.renderer = UIRenderer(self.console)
         self.shortcut_manager = get_shortcut_manager()
-        self.editor: Optional[OpenXComSaveEditor] = None
+        self.editor: Optional["OpenXComSaveEditor"] = None
         self.save_file_path: Optional[str] = None
+        self._shortcut_prompts: Dict[tuple, Tuple[str, Any]] = {}
+        self._legacy_cli: Optional[SaveEditorCLI] = None
+        
+        # Value of the changes banner last rendered by run(); None forces a redraw
+        self._shown_changes_status: Optional[bool] = None
+        self._footer_shown = False
+        
+        # Main menu action -> handler; "exit" is handled in run() since it ends the loop
+        self._actions = {
+            "status": self.handle_status,
+            "money": self.handle_money_menu,
+            "research": self.handle_research_menu,
+            "soldiers": self.handle_soldiers_menu,
+            "facilities": self.handle_facilities_menu,
+            "production": self.handle_production_menu,
+            "inventory": self.handle_inventory_menu,
+            "backup": self.handle_backup_menu,
+            "save": self.handle_save,
+            "reset": self.handle_reset,
+            "theme": self.handle_theme_menu,
+            "help": self.show_help,
+        }
         
         # Set up keyboard shortcuts
         self._setup_shortcuts()
@@ -51,34 +151,58 @@ class EnhancedSaveEditorCLI:
                 choices=choices,
             ).execute()
         
-        while True:
-            # Show shortcut prompt first
-            try:
-                shortcut_keys = ', '.join([f"'{k}'" for k in shortcuts.keys()])
-                shortcut_input = inquirer.text(
-                    message=f"Enter shortcut ({shortcut_keys}) or press Enter for menu:",
-                    default="",
-                ).execute().lower().strip()
-                
-                # Check if it's a valid shortcut
-                if shortcut_input in shortcuts:
-                    return shortcuts[shortcut_input]
-                elif shortcut_input == "":
-                    # Show the regular menu
-                    return inquirer.select(
-                        message="Select an option:",
-                        choices=choices,
-                    ).execute()
-                else:
-                    self.renderer.render_warning_message(f"Unknown shortcut: '{shortcut_input}'")
-                    continue
-                    
-            except (KeyboardInterrupt, EOFError):
-                return "exit"
+        try:
+            # One keystroke: a shortcut returns its action, any other key opens the menu
+            action = self._read_shortcut_key(shortcuts)
+            if action is not None:
+                return action
+            return inquirer.select(
+                message="Select an option:",
+                choices=choices,
+            ).execute()
+        except (KeyboardInterrupt, EOFError):
+            return "exit"
+    
+    def _read_shortcut_key(self, shortcuts: dict) -> Optional[str]:
+        """Wait for a single keypress; return its shortcut action, or None for any other key."""
+        from prompt_toolkit.application import Application
+        from prompt_toolkit.layout import FormattedTextControl, Layout, Window
+        
+        message, bindings = self._shortcut_prompt(shortcuts)
+        app = Application(
+            layout=Layout(Window(FormattedTextControl(message), height=1)),
+            key_bindings=bindings,
+            full_screen=False,
+        )
+        return app.run()
+    
+    def _shortcut_prompt(self, shortcuts: dict) -> Tuple[str, Any]:
+        """Prompt text and key bindings for a shortcut map, built once per distinct map."""
+        cache_key = tuple(shortcuts.items())
+        prompt = self._shortcut_prompts.get(cache_key)
+        if prompt is None:
+            from prompt_toolkit.key_binding import KeyBindings
+            
+            bindings = KeyBindings()
+            for key, action in shortcuts.items():
+                def handler(event, action=action):
+                    event.app.exit(result=action)
+                bindings.add(key)(handler)
+                if key.upper() != key:
+                    bindings.add(key.upper())(handler)
+            bindings.add('<any>')(lambda event: event.app.exit(result=None))
+            bindings.add('c-c')(lambda event: event.app.exit(exception=KeyboardInterrupt()))
+            bindings.add('c-d')(lambda event: event.app.exit(exception=EOFError()))
+            
+            shortcut_keys = ', '.join(f"'{k}'" for k in shortcuts)
+            message = f"Press a shortcut ({shortcut_keys}) or any other key for the menu"
+            prompt = self._shortcut_prompts[cache_key] = (message, bindings)
+        return prompt
     
     def run(self):
         """Main CLI loop with enhanced UI."""
-        self.renderer.render_welcome_screen()
+        renderer = self.renderer
+        renderer.render_welcome_screen()
         
         # Load save file
         if not self.load_save_file():
@@ -87,11 +211,12 @@ class EnhancedSaveEditorCLI:
         # Main menu loop
         while True:
             try:
-                # Clear and show current state
-                self.renderer.console.print()
-                self.renderer.render_changes_status(
-                    self.editor.has_changes() if self.editor else False
-                )
+                # Show current state, only when it differs from the banner last shown
+                has_changes = self.editor.has_changes() if self.editor else False
+                if has_changes != self._shown_changes_status:
+                    renderer.console.print()
+                    renderer.render_changes_status(has_changes)
+                    self._shown_changes_status = has_changes
                 
                 # Show main menu with shortcuts
                 action = self.show_enhanced_main_menu()
@@ -99,58 +224,45 @@ class EnhancedSaveEditorCLI:
                 if action == "exit":
                     if self.handle_exit():
                         break
-                elif action == "status":
-                    self.handle_status()
-                elif action == "money":
-                    self.handle_money_menu()
-                elif action == "research":
-                    self.handle_research_menu()
-                elif action == "soldiers":
-                    self.handle_soldiers_menu()
-                elif action == "facilities":
-                    self.handle_facilities_menu()
-                elif action == "production":
-                    self.handle_production_menu()
-                elif action == "inventory":
-                    self.handle_inventory_menu()
-                elif action == "backup":
-                    self.handle_backup_menu()
-                elif action == "save":
-                    self.handle_save()
-                elif action == "reset":
-                    self.handle_reset()
-                elif action == "theme":
-                    self.handle_theme_menu()
-                elif action == "help":
-                    self.show_help()
+                else:
+                    handler = self._actions.get(action)
+                    if handler is not None:
+                        handler()
                     
             except KeyboardInterrupt:
-                self.renderer.render_warning_message("Operation cancelled")
+                renderer.render_warning_message("Operation cancelled")
             except Exception as e:
-                self.renderer.render_error_message(f"Error: {e}")
+                renderer.render_error_message(f"Error: {e}")
     
     def load_save_file(self) -> bool:
         """Load a save file with enhanced file selection."""
-        # Look for .sav files in current directory
-        current_dir = Path.cwd()
-        save_files = list(current_dir.glob("*.sav"))
+        # Look for .sav files in current directory; one scandir pass, filtered by
+        # name before any stat, and DirEntry caches the stat for the size column
+        with os.scandir(os.getcwd()) as entries:
+            save_files = [
+                entry for entry in entries
+                if entry.name.endswith('.sav') and entry.is_file()
+            ]
         
         if not save_files:
             self.renderer.render_warning_message("No .sav files found in the current directory.")
             file_path = inquirer.filepath(
                 message="Enter path to save file:",
-                validate=lambda path: Path(path).exists() and Path(path).suffix.lower() == '.sav',
+                validate=_validate_sav_path,
                 invalid_message="File must exist and have .sav extension"
             ).execute()
         else:
-            # Show available save files with file sizes
-            choices = []
-            for f in save_files:
-                size_mb = f.stat().st_size / 1024 / 1024
-                choices.append({
-                    "name": f"{f.name} ({size_mb:.1f} MB)",
-                    "value": str(f)
-                })
+            # Show available save files with file sizes, largest (usually the
+            # latest campaign save) first; one stat per file, cached on the entry
+            sized_files = sorted(
+                ((entry.stat().st_size, entry) for entry in save_files),
+                key=itemgetter(0),
+                reverse=True,
+            )
+            choices = [
+                {"name": f"{entry.name} ({size / 1024 / 1024:.1f} MB)", "value": entry.path}
+                for size, entry in sized_files
+            ]
             choices.append({"name": "Browse for file...", "value": "browse"})
             
             selected = inquirer.select(
@@ -161,13 +273,15 @@ class EnhancedSaveEditorCLI:
             if selected == "browse":
                 file_path = inquirer.filepath(
                     message="Enter path to save file:",
-                    validate=lambda path: Path(path).exists() and Path(path).suffix.lower() == '.sav',
+                    validate=_validate_sav_path,
                     invalid_message="File must exist and have .sav extension"
                 ).execute()
             else:
                 file_path = selected
         
         try:
+            from .editor import OpenXComSaveEditor
+            
             self.save_file_path = file_path
             self.editor = OpenXComSaveEditor(file_path)
             
@@ -182,42 +296,18 @@ class EnhancedSaveEditorCLI:
     
     def show_enhanced_main_menu(self) -> str:
         """Show the main menu with enhanced styling and shortcuts."""
-        # Show shortcuts help
-        shortcuts = {
-            "s": "Status", "m": "Money", "r": "Research", "a": "Soldiers", 
-            "f": "Facilities", "p": "Production", "i": "Inventory",
-            "t": "Theme", "h": "Help", "q": "Quit"
-        }
-        
-        self.renderer.render_footer(
-            status="Select an option or use keyboard shortcuts",
-            shortcuts=shortcuts
-        )
-        
-        choices = [
-            {"name": "[S] 📊 Show Status", "value": "status"},
-            {"name": "[M] 💰 Edit Money/Funds", "value": "money"},
-            {"name": "[R] 🔬 Manage Research", "value": "research"},
-            {"name": "[A] 👤 Edit Soldiers/Agents", "value": "soldiers"},
-            {"name": "[F] 🏗️ Manage Facilities", "value": "facilities"},
-            {"name": "[P] ⚙️ Manage Production", "value": "production"},
-            {"name": "[I] 📦 Edit Inventory", "value": "inventory"},
-            {"name": "[B] 🗂️ Backup Management", "value": "backup"},
-            {"name": "[T] 🎨 Change Theme", "value": "theme"},
-            {"name": "💾 Save Changes", "value": "save"},
-            {"name": "↺ Reset All Changes", "value": "reset"},
-            {"name": "[H] ❓ Help", "value": "help"},
-            {"name": "[Q] ❌ Exit", "value": "exit"},
-        ]
+        # The footer is static; draw it again only after a theme change
+        if not self._footer_shown:
+            self.renderer.render_footer(
+                status="Select an option or use keyboard shortcuts",
+                shortcuts=_MAIN_MENU_FOOTER
+            )
+            self._footer_shown = True
         
         return self._select_with_shortcuts(
             message="Select an option:",
-            choices=choices,
-            shortcuts={
-                's': 'status', 'm': 'money', 'r': 'research', 'a': 'soldiers',
-                'f': 'facilities', 'p': 'production', 'i': 'inventory', 
-                'b': 'backup', 't': 'theme', 'h': 'help', 'q': 'exit'
-            }
+            choices=list(_MAIN_MENU_CHOICES),
+            shortcuts=_MAIN_MENU_SHORTCUTS
         )
     
     def handle_status(self):
@@ -226,13 +316,15 @@ class EnhancedSaveEditorCLI:
             return
         
         self.renderer.push_breadcrumb("Status")
-        self.renderer.render_header_with_breadcrumb("Status Dashboard")
-        
         status = self.editor.get_quick_status()
-        self.renderer.render_status_dashboard(status)
+        
+        # Buffer the whole screen; Rich writes it out in one go on exit
+        with self.renderer.console:
+            self.renderer.render_header_with_breadcrumb("Status Dashboard")
+            self.renderer.render_status_dashboard(status)
         
         # Wait for user input
-        inquirer.confirm("Press Enter to continue...").execute()
+        pause()
         self.renderer.pop_breadcrumb()
     
     def handle_money_menu(self):
@@ -240,29 +332,30 @@ class EnhancedSaveEditorCLI:
         if not self.editor:
             return
         
-        self.renderer.push_breadcrumb("Money")
-        self.renderer.render_header_with_breadcrumb("Money Management")
+        renderer = self.renderer
+        format_currency = renderer.format_currency
+        money_manager = self.editor.money_manager
+        
+        renderer.push_breadcrumb("Money")
         
-        current, previous = self.editor.money_manager.get_funds_display()
+        current, previous = money_manager.get_funds_display()
         
         # Show current funds in a styled way
         funds_info = {
-            "Current Funds": self.renderer.format_currency(current),
-            "Previous Month": self.renderer.format_currency(previous),
+            "Current Funds": format_currency(current),
+            "Previous Month": format_currency(previous),
         }
         
-        table = self.renderer.layout_manager.create_info_table(
+        table = renderer.layout_manager.create_info_table(
             data=funds_info,
             title="💰 Current Funding Status"
         )
-        self.renderer.console.print(table)
-        self.renderer.console.print()
+        with renderer.console:
+            renderer.render_header_with_breadcrumb("Money Management")
+            renderer.console.print(table)
+            renderer.console.print()
         
-        choices = [
-            {"name": "Set new amount", "value": "set"},
-            {"name": "Add funds", "value": "add"},
-            {"name": "Back to main menu", "value": "back"},
-        ]
+        choices = list(_MONEY_MENU_CHOICES)
         
         action = inquirer.select(
             message="What would you like to do?",
@@ -277,8 +370,8 @@ class EnhancedSaveEditorCLI:
                 default=current
             ).execute()
             
-            self.editor.money_manager.set_current_month_funds(int(amount))
-            self.renderer.render_success_message(f"Funds set to {self.renderer.format_currency(int(amount))}")
+            money_manager.set_current_month_funds(int(amount))
+            renderer.render_success_message(f"Funds set to {format_currency(int(amount))}")
         
         elif action == "add":
             amount = inquirer.number(
@@ -288,48 +381,48 @@ class EnhancedSaveEditorCLI:
                 default=1000000
             ).execute()
             
-            self.editor.money_manager.add_funds(int(amount))
-            new_amount = self.editor.money_manager.get_funds_display()[0]
-            self.renderer.render_success_message(f"Funds changed to {self.renderer.format_currency(new_amount)}")
+            money_manager.add_funds(int(amount))
+            new_amount = money_manager.get_funds_display()[0]
+            renderer.render_success_message(f"Funds changed to {format_currency(new_amount)}")
         
-        self.renderer.pop_breadcrumb()
+        renderer.pop_breadcrumb()
     
     def handle_research_menu(self):
         """Handle research management with enhanced display."""
         if not self.editor:
             return
         
-        self.renderer.push_breadcrumb("Research")
-        self.renderer.render_header_with_breadcrumb("Research Management")
+        renderer = self.renderer
+        renderer.push_breadcrumb("Research")
         
         research_manager = self.editor.research_manager
         active_projects = research_manager.get_active_research_projects()
         
         if not active_projects:
-            self.renderer.render_warning_message("No active research projects found.")
-            self.renderer.pop_breadcrumb()
+            with renderer.console:
+                renderer.render_header_with_breadcrumb("Research Management")
+                renderer.render_warning_message("No active research projects found.")
+            renderer.pop_breadcrumb()
             return
         
-        self.renderer.render_info_message(f"Found {len(active_projects)} active research project(s)")
-        
-        # Show research projects in a table
-        project_data = []
-        for proj in active_projects:
-            project_data.append({
-                "name": proj.display_name,
-                "progress": f"{proj.progress_percentage:.1f}%"
-            })
+        # Format each project once; the table and the project picker share the strings
+        formatted = [(proj, proj.display_name, f"{proj.progress_percentage:.1f}%")
+                     for proj in active_projects]
         
-        self.renderer.render_table_with_data(
-            data=project_data,
-            title="🔬 Active Research Projects",
-            columns=["name", "progress"]
-        )
+        with renderer.console:
+            renderer.render_header_with_breadcrumb("Research Management")
+            renderer.render_info_message(f"Found {len(active_projects)} active research project(s)")
+            
+            # Show research projects in a table
+            renderer.render_table_with_data(
+                data=[{"name": name, "progress": progress} for _, name, progress in formatted],
+                title="🔬 Active Research Projects",
+                columns=["name", "progress"]
+            )
         
         choices = [
             {"name": f"Complete all research projects ({len(active_projects)} projects)", "value": "complete_all"},
-            {"name": "Complete individual project", "value": "complete_individual"},
-            {"name": "Back to main menu", "value": "back"},
+            *_RESEARCH_MENU_TAIL,
         ]
         
         action = inquirer.select(
@@ -345,14 +438,14 @@ class EnhancedSaveEditorCLI:
             
             if confirm:
                 completed_count = research_manager.complete_all_research_projects()
-                self.renderer.render_success_message(f"Completed {completed_count} research projects")
+                renderer.render_success_message(f"Completed {completed_count} research projects")
         
         elif action == "complete_individual":
             # Show list of projects
             project_choices = [
-                {"name": f"{proj.display_name} ({proj.progress_percentage:.1f}% complete)", "value": proj}
-                for proj in active_projects
-            ] + [{"name": "Back", "value": "back"}]
+                {"name": f"{name} ({progress} complete)", "value": proj}
+                for proj, name, progress in formatted
+            ] + [_BACK_CHOICE]
             
             selected_project = inquirer.select(
                 message="Select project to complete:",
@@ -361,9 +454,9 @@ class EnhancedSaveEditorCLI:
             
             if selected_project != "back":
                 research_manager.complete_research_project(selected_project)
-                self.renderer.render_success_message(f"Completed research: {selected_project.display_name}")
+                renderer.render_success_message(f"Completed research: {selected_project.display_name}")
         
-        self.renderer.pop_breadcrumb()
+        renderer.pop_breadcrumb()
     
     def handle_theme_menu(self):
         """Handle theme selection with live preview."""
@@ -380,7 +473,7 @@ class EnhancedSaveEditorCLI:
         theme_choices = [
             {"name": f"{theme.title()} {'(current)' if theme == current_theme else ''}", "value": theme}
             for theme in available_themes
-        ] + [{"name": "Back", "value": "back"}]
+        ] + [_BACK_CHOICE]
         
         selected_theme = inquirer.select(
             message="Select theme:",
@@ -389,17 +482,17 @@ class EnhancedSaveEditorCLI:
         
         if selected_theme != "back" and selected_theme != current_theme:
             if self.renderer.set_theme(selected_theme):
-                self.renderer.render_success_message(f"Theme changed to {selected_theme.title()}")
-                
-                # Show a preview of the new theme
-                self.renderer.render_info_message("New theme applied!")
-                
-                # Quick preview
-                sample_status = {
-                    "Sample": {"Item 1": 100, "Item 2": "Active"},
-                    "Preview": {"Colors": "Updated", "Style": "New Theme"}
-                }
-                self.renderer.render_status_dashboard(sample_status)
+                # Redraw the banner and footer in the new theme
+                self._shown_changes_status = None
+                self._footer_shown = False
+                with self.renderer.console:
+                    self.renderer.render_success_message(f"Theme changed to {selected_theme.title()}")
+                    
+                    # Show a preview of the new theme
+                    self.renderer.render_info_message("New theme applied!")
+                    
+                    # Quick preview
+                    self.renderer.render_status_dashboard(_THEME_PREVIEW_STATUS)
             else:
                 self.renderer.render_error_message("Failed to change theme")
         
@@ -407,81 +500,48 @@ class EnhancedSaveEditorCLI:
     
     def show_help(self):
         """Show comprehensive help."""
-        self.renderer.render_header_with_breadcrumb("Help & Information")
-        
-        help_text = """
-[bold blue]OpenXCom Save Editor v2.0[/bold blue]
-
-This enhanced version includes:
-• Multiple theme support (default, dark, light, cyberpunk)
-• Improved navigation with breadcrumbs
-• Consistent styling and better information display
-• Enhanced status dashboard
-
-[bold yellow]Main Features:[/bold yellow]
-• Edit funds and resources
-• Complete research projects instantly
-• Modify soldier stats and abilities
-• Manage base facilities and production
-• Comprehensive backup system
-
-[bold green]Keyboard Shortcuts:[/bold green]
-• s - Status dashboard
-• m - Money management
-• r - Research management
-• a - Soldier (agents) management
-• f - Facilities management
-• p - Production management
-• i - Inventory management
-• t - Theme selection
-• h - This help screen
-• q - Quit application
-
-[bold red]Important Notes:[/bold red]
-• Always backup your saves before editing
-• This editor is designed for OpenXCom Extended + X-Com Files mod
-• Changes are not saved until you explicitly save them
-        """
-        
-        self.renderer.console.print(help_text)
-        inquirer.confirm("Press Enter to continue...").execute()
+        with self.renderer.console:
+            self.renderer.render_header_with_breadcrumb("Help & Information")
+            self.renderer.console.print(_HELP_TEXT)
+        pause()
     
     def show_shortcuts_help(self):
         """Show keyboard shortcuts help."""
         shortcuts = self.shortcut_manager.get_shortcut_help("menu")
         self.renderer.render_footer(shortcuts=shortcuts)
-        inquirer.confirm("Press Enter to continue...").execute()
+        pause()
+    
+    def _legacy(self) -> SaveEditorCLI:
+        """Original CLI used for the menus not ported yet; created once and kept on the current editor."""
+        legacy = self._legacy_cli
+        if legacy is None:
+            legacy = self._legacy_cli = SaveEditorCLI()
+            legacy._console = self.console
+        if legacy.editor is not self.editor:
+            legacy.editor = self.editor
+            legacy._backup_future = None  # A pending listing belongs to the old save
+        return legacy
     
     def handle_soldiers_menu(self):
         """Placeholder - delegate to original CLI for now."""
         # For now, we'll use the original implementation
-        original_cli = SaveEditorCLI()
-        original_cli.editor = self.editor
-        original_cli.handle_soldiers_menu()
+        self._legacy().handle_soldiers_menu()
     
     def handle_facilities_menu(self):
         """Placeholder - delegate to original CLI for now."""
-        original_cli = SaveEditorCLI()
-        original_cli.editor = self.editor
-        original_cli.handle_facilities_menu()
+        self._legacy().handle_facilities_menu()
     
     def handle_production_menu(self):
         """Placeholder - delegate to original CLI for now."""
-        original_cli = SaveEditorCLI()
-        original_cli.editor = self.editor
-        original_cli.handle_production_menu()
+        self._legacy().handle_production_menu()
     
     def handle_inventory_menu(self):
         """Placeholder - delegate to original CLI for now."""
-        original_cli = SaveEditorCLI()
-        original_cli.editor = self.editor
-        original_cli.handle_inventory_menu()
+        self._legacy().handle_inventory_menu()
     
     def handle_backup_menu(self):
         """Placeholder - delegate to original CLI for now."""
-        original_cli = SaveEditorCLI()
-        original_cli.editor = self.editor
-        original_cli.handle_backup_menu()
+        self._legacy().handle_backup_menu()
     
     def handle_save(self):
         """Handle saving with enhanced feedback."""
@@ -495,13 +555,7 @@ This enhanced version includes:
         # Show changes summary
         changes = self.editor.get_all_changes_summary()
         
-        if changes['modified']:
-            self.renderer.render_info_message("Changes to be saved:")
-            for key, change in changes['modified'].items():
-                field = change.get('field', key)
-                current = change.get('current', 'Modified')
-                self.renderer.console.print(f"  • {field}: {current}")
-            self.renderer.console.print()
+        self._print_modified_changes(changes, "Changes to be saved:")
         
         # Confirm save
         confirm = inquirer.confirm(
@@ -510,18 +564,7 @@ This enhanced version includes:
         ).execute()
         
         if confirm:
-            create_backup = inquirer.confirm(
-                "Create backup before saving?",
-                default=True
-            ).execute()
-            
-            success = self.editor.commit_changes(create_backup)
-            if success:
-                self.renderer.render_success_message("Changes saved successfully!")
-                if create_backup:
-                    self.renderer.render_success_message("Backup created before saving")
-            else:
-                self.renderer.render_error_message("Failed to save changes")
+            self._commit()
     
     def handle_reset(self):
         """Handle resetting changes with enhanced feedback."""
@@ -535,13 +578,7 @@ This enhanced version includes:
         # Show what will be reset
         changes = self.editor.get_all_changes_summary()
         
-        if changes['modified']:
-            self.renderer.render_info_message("Changes that will be reset:")
-            for key, change in changes['modified'].items():
-                field = change.get('field', key)
-                current = change.get('current', 'Modified')
-                self.renderer.console.print(f"  • {field}: {current}")
-            self.renderer.console.print()
+        self._print_modified_changes(changes, "Changes that will be reset:")
         
         confirm = inquirer.confirm(
             "Reset all changes to original values?",
@@ -562,15 +599,11 @@ This enhanced version includes:
             
             action = inquirer.select(
                 message="What would you like to do?",
-                choices=[
-                    {"name": "Save changes and exit", "value": "save"},
-                    {"name": "Exit without saving", "value": "discard"},
-                    {"name": "Cancel (don't exit)", "value": "cancel"},
-                ],
+                choices=list(_EXIT_CHOICES),
             ).execute()
             
             if action == "save":
-                if self._save_on_exit():
+                if self._commit():
                     self.renderer.render_success_message("Goodbye!")
                     return True
                 else:
@@ -592,8 +625,20 @@ This enhanced version includes:
             self.renderer.render_success_message("Goodbye!")
             return True
     
-    def _save_on_exit(self) -> bool:
-        """Save when exiting."""
+    def _print_modified_changes(self, changes: Dict[str, Any], heading: str):
+        """List the modified fields from a changes summary under a heading."""
+        if changes['modified']:
+            lines = "\n".join(
+                f"  • {change.get('field', key)}: {change.get('current', 'Modified')}"
+                for key, change in changes['modified'].items()
+            )
+            with self.renderer.console:
+                self.renderer.render_info_message(heading)
+                self.renderer.console.print(lines)
+                self.renderer.console.print()
+    
+    def _commit(self) -> bool:
+        """Ask about a backup, save the changes and report the result."""
         create_backup = inquirer.confirm(
             "Create backup before saving?",
             default=True
@@ -611,7 +656,7 @@ This enhanced version includes:
 
 
 @click.command()
-@click.option('--theme', type=click.Choice(['default', 'dark', 'light', 'cyberpunk']), 
+@click.option('--theme', type=click.Choice(get_available_themes()), 
               help='Set the UI theme')
 @click.option('--legacy', is_flag=True, help='Use the original CLI interface')
 def main(theme, legacy):
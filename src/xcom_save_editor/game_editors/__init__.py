@@ -3,14 +3,6 @@ Game editors package for OpenXCom save file modification.
 Contains managers for different aspects of the save game.
 """
 
-from .base_manager import BaseManager
-from .money_manager import MoneyManager
-from .research_manager import ResearchManager
-from .soldier_manager import SoldierManager
-from .facility_manager import FacilityManager
-from .production_manager import ProductionManager
-from .inventory_manager import InventoryManager
-
 __all__ = [
     'BaseManager',
     'MoneyManager',
@@ -19,4 +11,30 @@ __all__ = [
     'FacilityManager',
     'ProductionManager',
     'InventoryManager'
-]
\ No newline at end of file
+]
+
+# Managers resolved on first access so a caller that needs one of them
+# doesn't load the other six modules
+_LAZY = {
+    'BaseManager': '.base_manager',
+    'MoneyManager': '.money_manager',
+    'ResearchManager': '.research_manager',
+    'SoldierManager': '.soldier_manager',
+    'FacilityManager': '.facility_manager',
+    'ProductionManager': '.production_manager',
+    'InventoryManager': '.inventory_manager',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
@@ -3,22 +3,142 @@ Base manager class providing common functionality for all save game data manager
 Handles snapshot management and change tracking.
 """
 import copy
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+
+@lru_cache(maxsize=4096)
+def _format_name(item_name: str) -> str:
+    """Format an OpenXCom string ID for display (memoized; IDs repeat a lot)."""
+    # Remove STR_ prefix and replace underscores with spaces
+    formatted = item_name.replace('STR_', '').replace('_', ' ')
+    return formatted.title()
+
+
+@lru_cache(maxsize=4096)
+def _parse_path(key_path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Split a dot-separated key path into ``(key, list_index)`` pairs (memoized).
+    
+    ``list_index`` is the key as an int, or None if it isn't a valid integer.
+    """
+    parts = []
+    for key in key_path.split('.'):
+        try:
+            index: Optional[int] = int(key)
+        except ValueError:
+            index = None
+        parts.append((key, index))
+    return tuple(parts)
+
+
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _fast_clone(obj: Any) -> Any:
+    """
+    Deep-copy a parsed save tree.
+    
+    Save data is plain dicts, lists and scalars, so this skips deepcopy's memo
+    and per-object dispatch; anything else falls back to ``copy.deepcopy``.
+    """
+    cls = type(obj)
+    if cls is dict:
+        return {key: (value if type(value) in _ATOMIC_TYPES else _fast_clone(value))
+                for key, value in obj.items()}
+    if cls is list:
+        return [value if type(value) in _ATOMIC_TYPES else _fast_clone(value) for value in obj]
+    if cls in _ATOMIC_TYPES:
+        return obj
+    return copy.deepcopy(obj)
+
+
+# Marks a top-level key that was absent from the save before an edit created it
+_MISSING = object()
 
 
 class BaseManager:
     """Base class for all save game data managers."""
     
-    def __init__(self, data: Dict[str, Any]):
+    def __init__(self, data: Dict[str, Any],
+                 on_write: Optional[Callable[[str, Any], None]] = None,
+                 original: Optional[Dict[str, Any]] = None,
+                 original_view: Optional[Callable[[], Dict[str, Any]]] = None):
         """
         Initialize manager with save game data.
         
         Args:
             data: The full save game data dictionary
+            on_write: Optional callback invoked as ``on_write(top_level_key, subtree)``
+                before any top-level branch is modified (used for lazy snapshots)
+            original: Pre-made copy of ``data`` to use as the original, so several
+                managers over the same save can share one copy
+            original_view: Optional callable returning the original data on demand;
+                with it no copy is kept here at all (copy-on-write: the owner
+                snapshots each branch through ``on_write`` before it changes)
         """
-        self.original_data = copy.deepcopy(data)
+        self._original_view = original_view
+        self._original = None if original_view is not None else (
+            _fast_clone(data) if original is None else original)
         self.current_data = data
+        self._on_write = on_write
         self.changes_made = False
+        # Top-level keys edited since the last baseline, so a reset restores only those
+        self._dirty_keys: Set[str] = set()
+        # Indexes of the bases edited since the last baseline; None once an edit
+        # wasn't tied to one base, so diffs must then compare every base
+        self._dirty_bases: Optional[Set[int]] = set()
+        # Bumped on every edit; never reset, so callers can detect edits in O(1)
+        self.mutation_count = 0
+        # Caches over the bases list are keyed on its identity and mutation_count:
+        # reset and restore swap the list out wholesale, every edit bumps the count
+        self._bases_cache: List[Tuple[int, Dict[str, Any]]] = []
+        self._bases_key: Tuple[Any, int] = (None, -1)
+        self._wrapper_cache: Dict[type, Tuple[Any, int, List[Any], Dict[int, List[Any]]]] = {}
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "BaseManager":
+        """
+        Copy only the mutable state.
+        
+        ``original_data`` is never modified in place, so the copy shares it.
+        The ``on_write`` and ``original_view`` hooks follow their owner if the
+        owner is being copied too (e.g. the whole editor). A manager copied on
+        its own is detached and keeps a private copy of its original.
+        """
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new.__dict__.update(self.__dict__)
+        new.current_data = copy.deepcopy(self.current_data, memo)
+        new._dirty_keys = set(self._dirty_keys)
+        new._wrapper_cache = {}
+        if self._dirty_bases is not None:
+            new._dirty_bases = set(self._dirty_bases)
+        
+        new._on_write = self._copy_hook(self._on_write, memo)
+        if self._original_view is not None:
+            new._original_view = self._copy_hook(self._original_view, memo)
+            if new._original_view is None:
+                new._original = _fast_clone(self._original_view())
+        return new
+    
+    @classmethod
+    def _read_only(cls, data: Dict[str, Any]) -> "BaseManager":
+        """A manager for reading ``data``, e.g. an original to diff against; nothing is copied."""
+        return cls(data, original=data)
+    
+    @staticmethod
+    def _copy_hook(hook: Optional[Callable], memo: Dict[int, Any]) -> Optional[Callable]:
+        """The same bound method on the copy of its owner, or None if the owner isn't being copied."""
+        owner = getattr(hook, '__self__', None)
+        if owner is not None and id(owner) in memo:
+            return getattr(memo[id(owner)], hook.__name__)
+        return None
+    
+    @property
+    def original_data(self) -> Dict[str, Any]:
+        """The save data as last loaded or committed; never modified in place."""
+        if self._original_view is not None:
+            return self._original_view()
+        return self._original
     
     def get_original_value(self, key_path: str) -> Any:
         """
@@ -46,27 +166,104 @@ class BaseManager:
             key_path: Dot-separated path to the value
             value: New value to set
         """
+        parts = _parse_path(key_path)
+        self._before_write(parts[0][0], parts[1][1] if len(parts) > 1 else None)
         self._set_nested_value(self.current_data, key_path, value)
+        self._mark_changed()
+    
+    def _before_write(self, top_level_key: str, base_index: Optional[int] = None) -> None:
+        """Notify the owner that a top-level branch is about to be modified.
+        
+        For ``bases``, ``base_index`` names the one base being edited; without it
+        the whole list counts as edited.
+        """
+        self._dirty_keys.add(top_level_key)
+        if top_level_key == 'bases' and self._dirty_bases is not None:
+            if base_index is None:
+                self._dirty_bases = None
+            else:
+                self._dirty_bases.add(base_index)
+        if self._on_write is not None:
+            self._on_write(top_level_key, self.current_data.get(top_level_key, _MISSING))
+    
+    def _mark_changed(self) -> None:
+        """Record an edit made to ``current_data``."""
         self.changes_made = True
+        self.mutation_count += 1
     
     def has_changes(self) -> bool:
         """Check if any changes have been made."""
         return self.changes_made
     
     def reset_changes(self) -> None:
-        """Reset all changes to original state."""
-        self.current_data = copy.deepcopy(self.original_data)
+        """
+        Reset all changes to original state.
+        
+        Other managers' edits survive unless they touched the same top-level
+        branch or, for ``bases``, the same base.
+        """
+        if not self.changes_made:
+            return
+        
+        # Only branches edited through this manager differ from the original
+        original = self.original_data
+        dirty_bases = self._dirty_bases
+        for key in list(self._dirty_keys):
+            if key == 'bases' and dirty_bases is not None and self._restore_bases(dirty_bases):
+                continue
+            self._before_write(key)
+            if key in original:
+                self.current_data[key] = _fast_clone(original[key])
+            else:
+                self.current_data.pop(key, None)
+        self._dirty_keys.clear()
+        self._dirty_bases = set()
         self.changes_made = False
+        self.mutation_count += 1
+    
+    def _restore_bases(self, base_indexes: Set[int]) -> bool:
+        """Restore only the given bases; False if the lists no longer line up."""
+        original_bases = self.original_data.get('bases')
+        current_bases = self.current_data.get('bases')
+        if not isinstance(original_bases, list) or not isinstance(current_bases, list):
+            return False
+        if len(original_bases) != len(current_bases):
+            return False
+        
+        for base_index in base_indexes:
+            self._before_write('bases', base_index)
+            current_bases = self.current_data['bases']
+            current_bases[base_index] = _fast_clone(original_bases[base_index])
+        return True
     
-    def update_original_data(self, new_data: Dict[str, Any]) -> None:
+    def update_original_data(self, new_data: Dict[str, Any],
+                             original: Optional[Dict[str, Any]] = None) -> None:
         """Update original data after successful save and reset change tracking.
         
         Args:
             new_data: The updated data dictionary
+            original: Optional ready-made copy of ``new_data`` to keep as the
+                original; lets several managers share one copy (never mutated)
+        """
+        self.rebind(new_data, original)
+    
+    def rebind(self, data: Dict[str, Any],
+               original: Optional[Dict[str, Any]] = None) -> None:
+        """Point this manager at new save data and treat it as unmodified.
+        
+        Lets the editor reuse managers across reset/restore instead of
+        rebuilding them; ``mutation_count`` keeps counting.
+        
+        Args:
+            data: The full save game data dictionary
+            original: Optional ready-made copy of ``data`` to keep as the original
         """
-        self.original_data = copy.deepcopy(new_data)
-        self.current_data = new_data
+        if self._original_view is None:
+            self._original = _fast_clone(data) if original is None else original
+        self.current_data = data
         self.changes_made = False
+        self._dirty_keys.clear()
+        self._dirty_bases = set()
     
     def get_changes_summary(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -91,25 +288,71 @@ class BaseManager:
         
         return changes
     
+    def _bases(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """``(base_index, base)`` for every well-formed base, type-checked once per edit or data swap."""
+        bases = self.get_current_value('bases')
+        if not isinstance(bases, list):
+            return []
+        
+        cached_bases, cached_count = self._bases_key
+        if cached_bases is not bases or cached_count != self.mutation_count:
+            self._bases_cache = [(i, base) for i, base in enumerate(bases) if isinstance(base, dict)]
+            self._bases_key = (bases, self.mutation_count)
+        return self._bases_cache
+    
+    def _wrapped(self, wrapper_cls: type,
+                 entries: Callable[[], Iterator[Tuple[int, int, Dict[str, Any]]]]
+                 ) -> Tuple[List[Any], Dict[int, List[Any]]]:
+        """
+        Wrap every entry as ``wrapper_cls(data, base_index, index)``, also grouped by base.
+        
+        Rebuilt only after an edit or a data swap; callers must not modify the results.
+        
+        Args:
+            wrapper_cls: View class over one entry dict (e.g. ``Facility``)
+            entries: Yields ``(base_index, index, data)`` for every entry to wrap
+        """
+        bases = self.get_current_value('bases')
+        cached = self._wrapper_cache.get(wrapper_cls)
+        if cached is not None and cached[0] is bases and cached[1] == self.mutation_count:
+            return cached[2], cached[3]
+        
+        wrappers = []
+        by_base: Dict[int, List[Any]] = {}
+        for base_index, index, data in entries():
+            wrapper = wrapper_cls(data, base_index, index)
+            wrappers.append(wrapper)
+            by_base.setdefault(base_index, []).append(wrapper)
+        
+        self._wrapper_cache[wrapper_cls] = (bases, self.mutation_count, wrappers, by_base)
+        return wrappers, by_base
+    
+    def _original_by_position(self,
+                              entries: Callable[["BaseManager"], Iterator[Tuple[int, int, Dict[str, Any]]]]
+                              ) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        """
+        Original entries keyed by ``(base_index, index)``, as raw dicts without wrappers.
+        
+        Args:
+            entries: Unbound entry iterator (e.g. ``ResearchManager._iter_research_data``)
+        """
+        original = self._read_only(self.original_data)
+        return {(base_index, index): data for base_index, index, data in entries(original)}
+    
     def _get_nested_value(self, data: Dict[str, Any], key_path: str) -> Any:
         """Get value from nested dictionary using dot notation."""
-        keys = key_path.split('.')
         current = data
         
-        for key in keys:
+        for key, index in _parse_path(key_path):
             if isinstance(current, dict):
                 if key in current:
                     current = current[key]
                 else:
                     return None
             elif isinstance(current, list):
-                try:
-                    index = int(key)
-                    if 0 <= index < len(current):
-                        current = current[index]
-                    else:
-                        return None
-                except ValueError:
+                if index is not None and 0 <= index < len(current):
+                    current = current[index]
+                else:
                     return None
             else:
                 return None
@@ -118,40 +361,34 @@ class BaseManager:
     
     def _set_nested_value(self, data: Dict[str, Any], key_path: str, value: Any) -> None:
         """Set value in nested dictionary using dot notation."""
-        keys = key_path.split('.')
+        parts = _parse_path(key_path)
         current = data
         
         # Navigate to the parent of the target key
-        for key in keys[:-1]:
+        for key, index in parts[:-1]:
             if isinstance(current, dict):
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
+                current = current.setdefault(key, {})
             elif isinstance(current, list):
-                try:
-                    index = int(key)
-                    if 0 <= index < len(current):
-                        current = current[index]
-                    else:
-                        raise IndexError(f"List index {index} out of range")
-                except ValueError:
+                if index is None:
                     raise ValueError(f"Invalid list index: {key}")
+                if 0 <= index < len(current):
+                    current = current[index]
+                else:
+                    raise IndexError(f"List index {index} out of range")
             else:
                 raise ValueError(f"Cannot navigate into {type(current)} with key {key}")
         
         # Set the final value
-        final_key = keys[-1]
+        final_key, index = parts[-1]
         if isinstance(current, dict):
             current[final_key] = value
         elif isinstance(current, list):
-            try:
-                index = int(final_key)
-                if 0 <= index < len(current):
-                    current[index] = value
-                else:
-                    raise IndexError(f"List index {index} out of range")
-            except ValueError:
+            if index is None:
                 raise ValueError(f"Invalid list index: {final_key}")
+            if 0 <= index < len(current):
+                current[index] = value
+            else:
+                raise IndexError(f"List index {index} out of range")
         else:
             raise ValueError(f"Cannot set value in {type(current)}")
     
@@ -170,6 +407,4 @@ class BaseManager:
     
     def _format_item_name(self, item_name: str) -> str:
         """Format OpenXCom item names for display."""
-        # Remove STR_ prefix and replace underscores with spaces
-        formatted = item_name.replace('STR_', '').replace('_', ' ')
-        return formatted.title()
\ No newline at end of file
+        return _format_name(item_name)
\ No newline at end of file
@@ -1,13 +1,15 @@
 """
 Facility manager for handling base facility construction in OpenXCom save files.
 """
-from typing import Any, Dict, List, Optional, Tuple
-from .base_manager import BaseManager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .base_manager import BaseManager, _format_name
 
 
 class Facility:
     """Represents a base facility."""
     
+    __slots__ = ('data', 'base_index', 'facility_index')
+    
     def __init__(self, facility_data: Dict[str, Any], base_index: int, facility_index: int):
         self.data = facility_data
         self.base_index = base_index
@@ -20,8 +22,7 @@ class Facility:
     @property
     def display_name(self) -> str:
         """Get formatted display name."""
-        name = self.type.replace('STR_', '').replace('_', ' ')
-        return name.title()
+        return _format_name(self.type)
     
     @property
     def x(self) -> int:
@@ -53,41 +54,61 @@ class Facility:
 class FacilityManager(BaseManager):
     """Manages base facilities across all bases."""
     
-    def get_all_facilities(self) -> List[Facility]:
-        """Get all facilities from all bases."""
-        facilities = []
-        bases = self.get_current_value('bases')
-        
-        if not isinstance(bases, list):
-            return facilities
-        
-        for base_index, base in enumerate(bases):
-            if not isinstance(base, dict) or 'facilities' not in base:
-                continue
-            
-            facility_list = base['facilities']
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # buildTime column parallel to the cached facility list, so construction
+        # queries scan one list instead of going through each Facility view
+        self._build_times: List[Optional[int]] = []
+        self._build_times_of: Any = None
+    
+    def _iter_facility_data(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """Yield ``(base_index, facility_index, facility_data)`` for every facility."""
+        for base_index, base in self._bases():
+            facility_list = base.get('facilities')
             if not isinstance(facility_list, list):
                 continue
             
             for facility_index, facility_data in enumerate(facility_list):
                 if isinstance(facility_data, dict):
-                    facility = Facility(facility_data, base_index, facility_index)
-                    facilities.append(facility)
-        
-        return facilities
+                    yield base_index, facility_index, facility_data
+    
+    def _facility_index(self) -> Tuple[List[Facility], Dict[int, List[Facility]]]:
+        """All facilities plus a per-base index, cached until the next edit."""
+        facilities, by_base = self._wrapped(Facility, self._iter_facility_data)
+        if self._build_times_of is not facilities:
+            self._build_times = [facility.data.get('buildTime') for facility in facilities]
+            self._build_times_of = facilities
+        return facilities, by_base
+    
+    def get_all_facilities(self) -> List[Facility]:
+        """Get all facilities from all bases."""
+        return list(self._facility_index()[0])
     
     def get_facilities_by_base(self, base_index: int) -> List[Facility]:
         """Get facilities for a specific base."""
-        all_facilities = self.get_all_facilities()
-        return [facility for facility in all_facilities if facility.base_index == base_index]
+        return list(self._facility_index()[1].get(base_index, ()))
     
     def get_facilities_under_construction(self) -> List[Facility]:
         """Get all facilities currently under construction."""
-        return [facility for facility in self.get_all_facilities() if facility.is_under_construction]
+        facilities = self._facility_index()[0]
+        return [facility for facility, build_time in zip(facilities, self._build_times)
+                if build_time is not None and build_time > 0]
+    
+    def count_under_construction(self) -> int:
+        """Count facilities under construction without building Facility objects."""
+        count = 0
+        for _, _, facility_data in self._iter_facility_data():
+            build_time = facility_data.get('buildTime')
+            if build_time is not None and build_time > 0:
+                count += 1
+        
+        return count
     
     def get_completed_facilities(self) -> List[Facility]:
         """Get all completed facilities."""
-        return [facility for facility in self.get_all_facilities() if facility.is_completed]
+        facilities = self._facility_index()[0]
+        return [facility for facility, build_time in zip(facilities, self._build_times)
+                if build_time is None or build_time <= 0]
     
     def complete_facility_construction(self, facility: Facility) -> None:
         """
@@ -115,12 +136,7 @@ class FacilityManager(BaseManager):
         Returns:
             Number of facilities completed
         """
-        facilities_under_construction = self.get_facilities_under_construction()
-        
-        for facility in facilities_under_construction:
-            self.complete_facility_construction(facility)
-        
-        return len(facilities_under_construction)
+        return self._complete_in_place(self.get_facilities_under_construction())
     
     def complete_base_facility_construction(self, base_index: int) -> int:
         """
@@ -132,13 +148,20 @@ class FacilityManager(BaseManager):
         Returns:
             Number of facilities completed
         """
-        base_facilities = self.get_facilities_by_base(base_index)
-        facilities_under_construction = [f for f in base_facilities if f.is_under_construction]
-        
-        for facility in facilities_under_construction:
-            self.complete_facility_construction(facility)
+        return self._complete_in_place(
+            [f for f in self.get_facilities_under_construction() if f.base_index == base_index]
+        )
+    
+    def _complete_in_place(self, facilities: List[Facility]) -> int:
+        """Drop ``buildTime`` from each facility's live dict as one edit; returns the count."""
+        if not facilities:
+            return 0
         
-        return len(facilities_under_construction)
+        self._before_write('bases')
+        for facility in facilities:
+            del facility.data['buildTime']
+        self._mark_changed()
+        return len(facilities)
     
     def set_facility_build_time(self, facility: Facility, hours: int) -> None:
         """
@@ -157,8 +180,7 @@ class FacilityManager(BaseManager):
             # Set build time
             current_data = self.get_current_value(facility_path)
             if isinstance(current_data, dict):
-                current_data['buildTime'] = hours
-                self.set_value(facility_path, current_data)
+                self.set_value(f"{facility_path}.buildTime", hours)
     
     def get_base_names(self) -> List[str]:
         """Get names of all bases."""
@@ -177,15 +199,21 @@ class FacilityManager(BaseManager):
     
     def get_facility_summary(self) -> Dict[str, Any]:
         """Get a summary of facility status across all bases."""
-        all_facilities = self.get_all_facilities()
+        all_facilities, by_base = self._facility_index()
         facilities_under_construction = self.get_facilities_under_construction()
+        building_by_base: Dict[int, List[Facility]] = {}
+        for facility in facilities_under_construction:
+            building_by_base.setdefault(facility.base_index, []).append(facility)
         
-        base_names = self.get_base_names()
+        bases = self.get_current_value('bases')
+        if not isinstance(bases, list):
+            bases = []
         base_summaries = []
         
-        for i, base_name in enumerate(base_names):
-            base_facilities = self.get_facilities_by_base(i)
-            base_under_construction = [f for f in base_facilities if f.is_under_construction]
+        for i, base in enumerate(bases):
+            base_name = base['name'] if isinstance(base, dict) and 'name' in base else f"Base {i + 1}"
+            base_facilities = by_base.get(i, ())
+            base_under_construction = building_by_base.get(i, ())
             
             base_summaries.append({
                 'name': base_name,
@@ -221,14 +249,12 @@ class FacilityManager(BaseManager):
         }
         
         # Compare original and current facility states
-        original_facilities = FacilityManager(self.original_data).get_facilities_under_construction()
-        current_facilities = self.get_facilities_under_construction()
-        
-        completed_count = len(original_facilities) - len(current_facilities)
+        original_count = FacilityManager._read_only(self.original_data).count_under_construction()
+        completed_count = original_count - self.count_under_construction()
         
         if completed_count > 0:
             changes['modified']['facilities_completed'] = {
-                'original': f"{len(original_facilities)} facilities under construction",
+                'original': f"{original_count} facilities under construction",
                 'current': f"{completed_count} facility construction(s) completed",
                 'field': 'Facility Construction'
             }
@@ -1,43 +1,54 @@
 """
 Inventory manager for handling base item storage in OpenXCom save files.
 """
-from typing import Any, Dict, List, Optional, Tuple
-from .base_manager import BaseManager
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .base_manager import BaseManager, _format_name
+
+
+@lru_cache(maxsize=4096)
+def _search_key(item_name: str) -> str:
+    """Lower-cased raw and display names of an item joined by a newline (memoized).
+    
+    Neither name contains a newline, so one substring test covers both.
+    """
+    return f"{item_name.lower()}\n{_format_name(item_name).lower()}"
 
 
 class InventoryManager(BaseManager):
     """Manages inventory/items across all bases."""
     
-    def get_all_base_inventories(self) -> Dict[int, Dict[str, int]]:
-        """Get inventory for all bases."""
-        inventories = {}
+    def _iter_base_inventories(self) -> Iterator[Tuple[int, Dict[str, int]]]:
+        """Yield ``(base_index, items)`` with the live items dicts; callers must not modify them."""
         bases = self.get_current_value('bases')
-        
         if not isinstance(bases, list):
-            return inventories
+            return
         
         for base_index, base in enumerate(bases):
-            if not isinstance(base, dict) or 'items' not in base:
-                inventories[base_index] = {}
-                continue
-            
-            items = base['items']
-            if isinstance(items, dict):
-                inventories[base_index] = items.copy()
-            else:
-                inventories[base_index] = {}
-        
-        return inventories
+            items = base.get('items') if isinstance(base, dict) else None
+            yield base_index, items if isinstance(items, dict) else {}
+    
+    def _base_items(self, base_index: int) -> Dict[str, int]:
+        """The live items dict of one base (empty if missing); callers must not modify it."""
+        bases = self.get_current_value('bases')
+        if not isinstance(bases, list) or not 0 <= base_index < len(bases):
+            return {}
+        base = bases[base_index]
+        items = base.get('items') if isinstance(base, dict) else None
+        return items if isinstance(items, dict) else {}
+    
+    def get_all_base_inventories(self) -> Dict[int, Dict[str, int]]:
+        """Get inventory for all bases."""
+        return {base_index: items.copy() for base_index, items in self._iter_base_inventories()}
     
     def get_base_inventory(self, base_index: int) -> Dict[str, int]:
         """Get inventory for a specific base."""
-        inventories = self.get_all_base_inventories()
-        return inventories.get(base_index, {})
+        return self._base_items(base_index).copy()
     
     def get_item_quantity(self, base_index: int, item_name: str) -> int:
         """Get quantity of a specific item in a base."""
-        inventory = self.get_base_inventory(base_index)
-        return inventory.get(item_name, 0)
+        return self._base_items(base_index).get(item_name, 0)
     
     def set_item_quantity(self, base_index: int, item_name: str, quantity: int) -> None:
         """
@@ -101,48 +112,53 @@ class InventoryManager(BaseManager):
     def get_all_unique_items(self) -> List[str]:
         """Get a list of all unique item types across all bases."""
         unique_items = set()
-        inventories = self.get_all_base_inventories()
         
-        for inventory in inventories.values():
+        for _, inventory in self._iter_base_inventories():
             unique_items.update(inventory.keys())
         
         return sorted(list(unique_items))
     
     def get_item_totals(self) -> Dict[str, int]:
         """Get total quantities of all items across all bases."""
-        totals = {}
-        inventories = self.get_all_base_inventories()
+        # Counter.update adds mappings in C instead of a Python-level lookup per item
+        totals: Counter = Counter()
         
-        for inventory in inventories.values():
-            for item_name, quantity in inventory.items():
-                if item_name in totals:
-                    totals[item_name] += quantity
-                else:
-                    totals[item_name] = quantity
+        for _, inventory in self._iter_base_inventories():
+            totals.update(inventory)
         
-        return totals
+        return dict(totals)
     
-    def search_items(self, search_term: str) -> Dict[str, int]:
+    def isearch_items(self, search_term: str) -> Iterator[Tuple[str, int]]:
         """
-        Search for items by name.
+        Lazily search for items by name.
         
         Args:
             search_term: Term to search for in item names
             
-        Returns:
-            Dictionary of matching items and their total quantities
+        Yields:
+            (item_name, total_quantity) pairs for each matching item
         """
         search_term = search_term.lower()
+        if '\n' in search_term:
+            return  # Would only ever match across the joined names
         totals = self.get_item_totals()
         
-        matching_items = {}
         for item_name, total_quantity in totals.items():
             # Search in both original name and formatted name
-            formatted_name = self._format_item_name(item_name).lower()
-            if search_term in item_name.lower() or search_term in formatted_name:
-                matching_items[item_name] = total_quantity
+            if search_term in _search_key(item_name):
+                yield item_name, total_quantity
+    
+    def search_items(self, search_term: str) -> Dict[str, int]:
+        """
+        Search for items by name.
         
-        return matching_items
+        Args:
+            search_term: Term to search for in item names
+            
+        Returns:
+            Dictionary of matching items and their total quantities
+        """
+        return dict(self.isearch_items(search_term))
     
     def get_base_names(self) -> List[str]:
         """Get names of all bases."""
@@ -161,14 +177,22 @@ class InventoryManager(BaseManager):
     
     def get_inventory_summary(self) -> Dict[str, Any]:
         """Get a summary of inventory status across all bases."""
-        inventories = self.get_all_base_inventories()
-        base_names = self.get_base_names()
-        all_unique_items = self.get_all_unique_items()
-        item_totals = self.get_item_totals()
+        bases = self.get_current_value('bases')
+        if not isinstance(bases, list):
+            bases = []
         
+        # One pass over the bases gathers names, per-base summaries and totals
+        item_totals: Counter = Counter()
         base_summaries = []
-        for i, base_name in enumerate(base_names):
-            inventory = inventories.get(i, {})
+        for i, base in enumerate(bases):
+            if isinstance(base, dict):
+                base_name = base['name'] if 'name' in base else f"Base {i + 1}"
+                inventory = base.get('items')
+                if not isinstance(inventory, dict):
+                    inventory = {}
+            else:
+                base_name, inventory = f"Base {i + 1}", {}
+            item_totals.update(inventory)
             
             # Sort items by quantity (descending) for better display
             sorted_items = sorted(inventory.items(), key=lambda x: x[1], reverse=True)
@@ -199,7 +223,7 @@ class InventoryManager(BaseManager):
         ]
         
         return {
-            'total_unique_items': len(all_unique_items),
+            'total_unique_items': len(item_totals),
             'total_items_across_all_bases': sum(item_totals.values()),
             'top_items': top_items,
             'bases': base_summaries
@@ -216,8 +240,26 @@ class InventoryManager(BaseManager):
         Returns:
             Number of items modified
         """
+        if any(quantity < 0 for quantity in item_modifications.values()):
+            raise ValueError("Item quantity cannot be negative")
+        if not item_modifications:
+            return 0
+        
+        base = self.get_current_value(f"bases.{base_index}")
+        if not isinstance(base, dict):
+            raise IndexError(f"Base index {base_index} out of range")
+        
+        # One snapshot and one edit for the whole batch, applied to the live dict
+        self._before_write('bases', base_index)
+        items = base.setdefault('items', {})
+        if not isinstance(items, dict):
+            raise ValueError(f"Cannot set value in {type(items)}")
         for item_name, quantity in item_modifications.items():
-            self.set_item_quantity(base_index, item_name, quantity)
+            if quantity == 0:
+                items.pop(item_name, None)
+            else:
+                items[item_name] = quantity
+        self._mark_changed()
         
         return len(item_modifications)
     
@@ -245,8 +287,8 @@ class InventoryManager(BaseManager):
             # Add to existing inventory
             target_inventory = self.get_base_inventory(target_base)
             for item_name, quantity in source_inventory.items():
-                current_quantity = target_inventory.get(item_name, 0)
-                self.set_item_quantity(target_base, item_name, current_quantity + quantity)
+                target_inventory[item_name] = target_inventory.get(item_name, 0) + quantity
+            self._write_base_inventory(target_base, target_inventory)
             return len(source_inventory)
         
         elif copy_mode == 'merge':
@@ -257,14 +299,22 @@ class InventoryManager(BaseManager):
             for item_name in all_items:
                 source_qty = source_inventory.get(item_name, 0)
                 target_qty = target_inventory.get(item_name, 0)
-                max_qty = max(source_qty, target_qty)
-                self.set_item_quantity(target_base, item_name, max_qty)
+                target_inventory[item_name] = max(source_qty, target_qty)
             
+            self._write_base_inventory(target_base, target_inventory)
             return len(all_items)
         
         else:
             raise ValueError(f"Invalid copy_mode: {copy_mode}")
     
+    def _write_base_inventory(self, base_index: int, items: Dict[str, int]) -> None:
+        """Store a whole items dict for a base as one edit, dropping zero quantities."""
+        if any(quantity < 0 for quantity in items.values()):
+            raise ValueError("Item quantity cannot be negative")
+        
+        self.set_value(f"bases.{base_index}.items",
+                       {name: quantity for name, quantity in items.items() if quantity != 0})
+    
     def get_changes_summary(self) -> Dict[str, Dict[str, Any]]:
         """Get summary of changes made to inventory."""
         if not self.has_changes():
@@ -276,25 +326,28 @@ class InventoryManager(BaseManager):
             'removed': {}
         }
         
-        # Compare original and current inventories
-        original_inventories = InventoryManager(self.original_data).get_all_base_inventories()
-        current_inventories = self.get_all_base_inventories()
+        # Compare original and current inventories, but only of the bases this
+        # manager edited; the live dicts are only compared, never modified
+        original = InventoryManager._read_only(self.original_data)
+        if self._dirty_bases is None:
+            base_indexes = [base_index for base_index, _ in self._iter_base_inventories()]
+        else:
+            base_indexes = sorted(self._dirty_bases)
         
         modified_bases = 0
         total_changes = 0
         
-        for base_index in current_inventories.keys():
-            original_inv = original_inventories.get(base_index, {})
-            current_inv = current_inventories.get(base_index, {})
+        for base_index in base_indexes:
+            original_inv = original._base_items(base_index)
+            current_inv = self._base_items(base_index)
             
             if original_inv != current_inv:
                 modified_bases += 1
                 
-                # Count individual item changes
-                all_items = set(original_inv.keys()) | set(current_inv.keys())
-                for item in all_items:
-                    if original_inv.get(item, 0) != current_inv.get(item, 0):
-                        total_changes += 1
+                # Count individual item changes; missing and zero compare equal
+                delta = Counter(current_inv)
+                delta.subtract(original_inv)
+                total_changes += sum(1 for count in delta.values() if count)
         
         if total_changes > 0:
             changes['modified']['inventory_items'] = {
@@ -54,8 +54,8 @@ class MoneyManager(BaseManager):
             raise ValueError("Previous month funds cannot be negative")
         
         funds = self.get_current_value('funds')
-        if not isinstance(funds, list):
-            funds = [0, 0]
+        # Work on a copy so the stored list is only replaced through set_value
+        funds = list(funds) if isinstance(funds, list) else [0, 0]
         
         # Update values with correct indices, keep any additional values unchanged
         funds[0] = previous_month  # Previous month at index 0
@@ -95,17 +95,18 @@ class MoneyManager(BaseManager):
         original_funds = self.get_original_value('funds')
         current_funds = self.get_current_value('funds')
         
-        changes = {
-            'modified': {},
+        # Funds edited back to their original values need no formatting at all
+        if original_funds == current_funds:
+            return {'modified': {}, 'added': {}, 'removed': {}}
+        
+        return {
+            'modified': {
+                'funds': {
+                    'original': f"Current: {original_funds[0]:,}, Previous: {original_funds[1]:,}",
+                    'current': f"Current: {current_funds[0]:,}, Previous: {current_funds[1]:,}",
+                    'field': 'Funds'
+                }
+            },
             'added': {},
             'removed': {}
-        }
-        
-        if original_funds != current_funds:
-            changes['modified']['funds'] = {
-                'original': f"Current: {original_funds[0]:,}, Previous: {original_funds[1]:,}",
-                'current': f"Current: {current_funds[0]:,}, Previous: {current_funds[1]:,}",
-                'field': 'Funds'
-            }
-        
-        return changes
\ No newline at end of file
+        }
\ No newline at end of file
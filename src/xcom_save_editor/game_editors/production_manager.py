@@ -1,13 +1,15 @@
 """
 Production manager for handling manufacturing queues in OpenXCom save files.
 """
-from typing import Any, Dict, List, Optional, Tuple
-from .base_manager import BaseManager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .base_manager import BaseManager, _format_name
 
 
 class ProductionItem:
     """Represents a production/manufacturing item."""
     
+    __slots__ = ('data', 'base_index', 'production_index')
+    
     def __init__(self, production_data: Dict[str, Any], base_index: int, production_index: int):
         self.data = production_data
         self.base_index = base_index
@@ -20,8 +22,7 @@ class ProductionItem:
     @property
     def display_name(self) -> str:
         """Get formatted display name."""
-        name = self.item_type.replace('STR_', '').replace('_', ' ')
-        return name.title()
+        return _format_name(self.item_type)
     
     @property
     def assigned_engineers(self) -> int:
@@ -60,39 +61,52 @@ class ProductionItem:
 class ProductionManager(BaseManager):
     """Manages production/manufacturing across all bases."""
     
-    def get_all_production_items(self) -> List[ProductionItem]:
-        """Get all production items from all bases."""
-        items = []
-        bases = self.get_current_value('bases')
-        
-        if not isinstance(bases, list):
-            return items
-        
-        for base_index, base in enumerate(bases):
-            if not isinstance(base, dict) or 'productions' not in base:
-                continue
-            
-            production_list = base['productions']
+    def _iter_production_data(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """Yield ``(base_index, production_index, production_data)`` for every production entry."""
+        for base_index, base in self._bases():
+            production_list = base.get('productions')
             if not isinstance(production_list, list):
                 continue
             
             for production_index, production_data in enumerate(production_list):
                 if isinstance(production_data, dict):
-                    item = ProductionItem(production_data, base_index, production_index)
-                    items.append(item)
-        
-        return items
+                    yield base_index, production_index, production_data
+    
+    def _production_items(self) -> List[ProductionItem]:
+        """All production items, cached until the next edit; callers must not modify the list."""
+        return self._wrapped(ProductionItem, self._iter_production_data)[0]
+    
+    def _production_items_by_base(self) -> Dict[int, List[ProductionItem]]:
+        """The cached production items grouped by base index; callers must not modify them."""
+        return self._wrapped(ProductionItem, self._iter_production_data)[1]
+    
+    def get_all_production_items(self) -> List[ProductionItem]:
+        """Get all production items from all bases."""
+        return list(self._production_items())
     
     def get_production_by_base(self, base_index: int) -> List[ProductionItem]:
         """Get production items for a specific base."""
-        all_items = self.get_all_production_items()
-        return [item for item in all_items if item.base_index == base_index]
+        return list(self._production_items_by_base().get(base_index, ()))
     
     def get_active_production_items(self) -> List[ProductionItem]:
         """Get production items that are currently being worked on."""
-        return [item for item in self.get_all_production_items() 
+        return [item for item in self._production_items() 
                 if item.assigned_engineers > 0 or item.time_spent > 0]
     
+    def count_active(self) -> int:
+        """Count active production items without building ProductionItem objects."""
+        count = 0
+        for _, base in self._bases():
+            production_list = base.get('productions')
+            if not isinstance(production_list, list):
+                continue
+            for production_data in production_list:
+                if isinstance(production_data, dict) and (
+                        production_data.get('assigned', 0) > 0 or production_data.get('spent', 0) > 0):
+                    count += 1
+        
+        return count
+    
     def complete_production_item(self, item: ProductionItem) -> None:
         """
         Complete production of a specific item by setting spent time high enough.
@@ -100,17 +114,20 @@ class ProductionManager(BaseManager):
         Args:
             item: The production item to complete
         """
+        item_path = f"bases.{item.base_index}.productions.{item.production_index}.spent"
+        self.set_value(item_path, self._completion_time(item))
+    
+    @staticmethod
+    def _completion_time(item: ProductionItem) -> int:
+        """Spent time that marks an item's production (or current batch) as done."""
         if item.is_infinite:
             # For infinite items, we can't really "complete" them
             # Instead, we'll set spent time to a high value to indicate completion of current batch
-            completion_time = max(100, item.time_spent + 50)
-        else:
-            # For regular items, set spent time to a value that would complete production
-            # This is simplified - in reality we'd need to know the actual production cost
-            completion_time = max(item.time_spent + item.amount_to_produce * 10, 100)
+            return max(100, item.time_spent + 50)
         
-        item_path = f"bases.{item.base_index}.productions.{item.production_index}.spent"
-        self.set_value(item_path, completion_time)
+        # For regular items, set spent time to a value that would complete production
+        # This is simplified - in reality we'd need to know the actual production cost
+        return max(item.time_spent + item.amount_to_produce * 10, 100)
     
     def complete_all_production_items(self) -> int:
         """
@@ -119,12 +136,7 @@ class ProductionManager(BaseManager):
         Returns:
             Number of items completed
         """
-        active_items = self.get_active_production_items()
-        
-        for item in active_items:
-            self.complete_production_item(item)
-        
-        return len(active_items)
+        return self._complete_in_place(self.get_active_production_items())
     
     def complete_base_production_items(self, base_index: int) -> int:
         """
@@ -136,13 +148,21 @@ class ProductionManager(BaseManager):
         Returns:
             Number of items completed
         """
-        base_items = self.get_production_by_base(base_index)
-        active_items = [item for item in base_items if item.assigned_engineers > 0 or item.time_spent > 0]
-        
-        for item in active_items:
-            self.complete_production_item(item)
+        base_items = self._production_items_by_base().get(base_index, ())
+        return self._complete_in_place(
+            [item for item in base_items if item.assigned_engineers > 0 or item.time_spent > 0]
+        )
+    
+    def _complete_in_place(self, items: List[ProductionItem]) -> int:
+        """Write each item's completion time into its live dict as one edit; returns the count."""
+        if not items:
+            return 0
         
-        return len(active_items)
+        self._before_write('bases')
+        for item in items:
+            item.data['spent'] = self._completion_time(item)
+        self._mark_changed()
+        return len(items)
     
     def set_production_progress(self, item: ProductionItem, hours: int) -> None:
         """
@@ -188,20 +208,25 @@ class ProductionManager(BaseManager):
     
     def get_production_summary(self) -> Dict[str, Any]:
         """Get a summary of production status across all bases."""
-        all_items = self.get_all_production_items()
-        active_items = self.get_active_production_items()
+        bases = self.get_current_value('bases')
+        if not isinstance(bases, list):
+            bases = []
         
-        base_names = self.get_base_names()
-        base_summaries = []
+        # Partition every item into per-base counts and active lists in one pass
+        base_totals = [0] * len(bases)
+        base_active: List[List[ProductionItem]] = [[] for _ in bases]
+        for item in self._production_items():
+            base_totals[item.base_index] += 1
+            if item.assigned_engineers > 0 or item.time_spent > 0:
+                base_active[item.base_index].append(item)
         
-        for i, base_name in enumerate(base_names):
-            base_items = self.get_production_by_base(i)
-            base_active = [item for item in base_items if item.assigned_engineers > 0 or item.time_spent > 0]
-            
+        base_summaries = []
+        for i, base in enumerate(bases):
+            base_name = base['name'] if isinstance(base, dict) and 'name' in base else f"Base {i + 1}"
             base_summaries.append({
                 'name': base_name,
-                'total_production_items': len(base_items),
-                'active_items': len(base_active),
+                'total_production_items': base_totals[i],
+                'active_items': len(base_active[i]),
                 'items_in_queue': [
                     {
                         'name': item.display_name,
@@ -210,13 +235,13 @@ class ProductionManager(BaseManager):
                         'engineers': item.assigned_engineers,
                         'infinite': item.is_infinite
                     }
-                    for item in base_active
+                    for item in base_active[i]
                 ]
             })
         
         return {
-            'total_production_items': len(all_items),
-            'active_items': len(active_items),
+            'total_production_items': sum(base_totals),
+            'active_items': sum(len(active) for active in base_active),
             'bases': base_summaries
         }
     
@@ -231,21 +256,13 @@ class ProductionManager(BaseManager):
             'removed': {}
         }
         
-        # Compare original and current production states
-        original_items = ProductionManager(self.original_data).get_all_production_items()
-        current_items = self.get_all_production_items()
+        # Compare original and current production entries by position
+        original_items = self._original_by_position(ProductionManager._iter_production_data)
         
         modified_count = 0
-        for current_item in current_items:
-            # Find corresponding original item
-            original_item = None
-            for orig_item in original_items:
-                if (orig_item.base_index == current_item.base_index and 
-                    orig_item.production_index == current_item.production_index):
-                    original_item = orig_item
-                    break
-            
-            if original_item and original_item.time_spent != current_item.time_spent:
+        for base_index, production_index, production_data in self._iter_production_data():
+            original = original_items.get((base_index, production_index))
+            if original is not None and original.get('spent', 0) != production_data.get('spent', 0):
                 modified_count += 1
         
         if modified_count > 0:
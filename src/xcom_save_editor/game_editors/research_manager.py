@@ -1,13 +1,15 @@
 """
 Research manager for handling research projects in OpenXCom save files.
 """
-from typing import Any, Dict, List, Optional, Tuple
-from .base_manager import BaseManager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .base_manager import BaseManager, _format_name
 
 
 class ResearchProject:
     """Represents a research project."""
     
+    __slots__ = ('data', 'base_index', 'project_index')
+    
     def __init__(self, project_data: Dict[str, Any], base_index: int, project_index: int):
         self.data = project_data
         self.base_index = base_index
@@ -20,8 +22,7 @@ class ResearchProject:
     @property
     def display_name(self) -> str:
         """Get formatted display name."""
-        name = self.name.replace('STR_', '').replace('_', ' ')
-        return name.title()
+        return _format_name(self.name)
     
     @property
     def assigned_scientists(self) -> int:
@@ -56,41 +57,53 @@ class ResearchProject:
 class ResearchManager(BaseManager):
     """Manages research projects across all bases."""
     
-    def get_all_research_projects(self) -> List[ResearchProject]:
-        """Get all active research projects from all bases."""
-        projects = []
-        bases = self.get_current_value('bases')
-        
-        if not isinstance(bases, list):
-            return projects
-        
-        for base_index, base in enumerate(bases):
-            if not isinstance(base, dict) or 'research' not in base:
-                continue
-            
-            research_list = base['research']
+    def _iter_research_data(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """Yield ``(base_index, project_index, project_data)`` for every research entry."""
+        for base_index, base in self._bases():
+            research_list = base.get('research')
             if not isinstance(research_list, list):
                 continue
             
             for project_index, project_data in enumerate(research_list):
                 if isinstance(project_data, dict):
-                    project = ResearchProject(project_data, base_index, project_index)
-                    projects.append(project)
-        
-        return projects
+                    yield base_index, project_index, project_data
+    
+    def _research_projects(self) -> List[ResearchProject]:
+        """All research projects, cached until the next edit; callers must not modify the list."""
+        return self._wrapped(ResearchProject, self._iter_research_data)[0]
+    
+    def _research_projects_by_base(self) -> Dict[int, List[ResearchProject]]:
+        """The cached research projects grouped by base index; callers must not modify them."""
+        return self._wrapped(ResearchProject, self._iter_research_data)[1]
+    
+    def get_all_research_projects(self) -> List[ResearchProject]:
+        """Get all active research projects from all bases."""
+        return list(self._research_projects())
     
     def get_active_research_projects(self) -> List[ResearchProject]:
         """Get only incomplete research projects."""
-        return [proj for proj in self.get_all_research_projects() if not proj.is_completed]
+        return [proj for proj in self._research_projects() if not proj.is_completed]
+    
+    def count_active(self) -> int:
+        """Count incomplete research projects without building ResearchProject objects."""
+        count = 0
+        for _, base in self._bases():
+            research_list = base.get('research')
+            if not isinstance(research_list, list):
+                continue
+            for project_data in research_list:
+                if isinstance(project_data, dict) and project_data.get('spent', 0) < project_data.get('cost', 0):
+                    count += 1
+        
+        return count
     
     def get_completed_research_projects(self) -> List[ResearchProject]:
         """Get completed research projects."""
-        return [proj for proj in self.get_all_research_projects() if proj.is_completed]
+        return [proj for proj in self._research_projects() if proj.is_completed]
     
     def get_research_by_base(self, base_index: int) -> List[ResearchProject]:
         """Get research projects for a specific base."""
-        all_projects = self.get_all_research_projects()
-        return [proj for proj in all_projects if proj.base_index == base_index]
+        return list(self._research_projects_by_base().get(base_index, ()))
     
     def complete_research_project(self, project: ResearchProject) -> None:
         """
@@ -109,12 +122,7 @@ class ResearchManager(BaseManager):
         Returns:
             Number of projects completed
         """
-        active_projects = self.get_active_research_projects()
-        
-        for project in active_projects:
-            self.complete_research_project(project)
-        
-        return len(active_projects)
+        return self._complete_in_place(self.get_active_research_projects())
     
     def complete_research_projects_by_base(self, base_index: int) -> int:
         """
@@ -126,13 +134,19 @@ class ResearchManager(BaseManager):
         Returns:
             Number of projects completed
         """
-        base_projects = self.get_research_by_base(base_index)
-        active_projects = [proj for proj in base_projects if not proj.is_completed]
-        
-        for project in active_projects:
-            self.complete_research_project(project)
+        base_projects = self._research_projects_by_base().get(base_index, ())
+        return self._complete_in_place([proj for proj in base_projects if not proj.is_completed])
+    
+    def _complete_in_place(self, projects: List[ResearchProject]) -> int:
+        """Set each project's spent time to its cost in the live dict as one edit; returns the count."""
+        if not projects:
+            return 0
         
-        return len(active_projects)
+        self._before_write('bases')
+        for project in projects:
+            project.data['spent'] = project.total_cost
+        self._mark_changed()
+        return len(projects)
     
     def set_research_progress(self, project: ResearchProject, progress_percentage: float) -> None:
         """
@@ -165,27 +179,33 @@ class ResearchManager(BaseManager):
     
     def get_research_summary(self) -> Dict[str, Any]:
         """Get a summary of research status across all bases."""
-        all_projects = self.get_all_research_projects()
-        active_projects = self.get_active_research_projects()
+        bases = self.get_current_value('bases')
+        if not isinstance(bases, list):
+            bases = []
         
-        base_names = self.get_base_names()
-        base_summaries = []
+        # Partition every project into per-base counters in one pass
+        base_totals = [0] * len(bases)
+        base_active = [0] * len(bases)
+        for project in self._research_projects():
+            base_totals[project.base_index] += 1
+            if not project.is_completed:
+                base_active[project.base_index] += 1
         
-        for i, base_name in enumerate(base_names):
-            base_projects = self.get_research_by_base(i)
-            base_active = [proj for proj in base_projects if not proj.is_completed]
-            
+        base_summaries = []
+        for i, base in enumerate(bases):
+            base_name = base['name'] if isinstance(base, dict) and 'name' in base else f"Base {i + 1}"
             base_summaries.append({
                 'name': base_name,
-                'total_projects': len(base_projects),
-                'active_projects': len(base_active),
-                'completed_projects': len(base_projects) - len(base_active)
+                'total_projects': base_totals[i],
+                'active_projects': base_active[i],
+                'completed_projects': base_totals[i] - base_active[i]
             })
         
+        total_projects, active_projects = sum(base_totals), sum(base_active)
         return {
-            'total_projects': len(all_projects),
-            'active_projects': len(active_projects),
-            'completed_projects': len(all_projects) - len(active_projects),
+            'total_projects': total_projects,
+            'active_projects': active_projects,
+            'completed_projects': total_projects - active_projects,
             'bases': base_summaries
         }
     
@@ -200,23 +220,19 @@ class ResearchManager(BaseManager):
             'removed': {}
         }
         
-        # Compare original and current research states
-        original_projects = ResearchManager(self.original_data).get_all_research_projects()
-        current_projects = self.get_all_research_projects()
+        # Compare original and current research entries by position
+        original_projects = self._original_by_position(ResearchManager._iter_research_data)
         
         completed_count = 0
-        for current_proj in current_projects:
-            # Find corresponding original project
-            original_proj = None
-            for orig_proj in original_projects:
-                if (orig_proj.base_index == current_proj.base_index and 
-                    orig_proj.project_index == current_proj.project_index):
-                    original_proj = orig_proj
-                    break
+        for base_index, project_index, project_data in self._iter_research_data():
+            original = original_projects.get((base_index, project_index))
+            if original is None:
+                continue
             
-            if original_proj and original_proj.time_spent != current_proj.time_spent:
-                if not original_proj.is_completed and current_proj.is_completed:
-                    completed_count += 1
+            original_spent, original_cost = original.get('spent', 0), original.get('cost', 0)
+            spent = project_data.get('spent', 0)
+            if original_spent != spent and original_spent < original_cost and spent >= project_data.get('cost', 0):
+                completed_count += 1
         
         if completed_count > 0:
             changes['modified']['research_completed'] = {
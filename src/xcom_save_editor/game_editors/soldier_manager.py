@@ -48,23 +48,27 @@ class Soldier:
         """Get initial value of a specific stat."""
         return self.initial_stats.get(stat_name, 0)
     
+    def set_stats_bulk(self, stats: Dict[str, int]) -> None:
+        """Write several current stats in one dict update (no validation)."""
+        self.data.setdefault('currentStats', {}).update(stats)
+    
     def __str__(self) -> str:
         return f"{self.name} (Rank {self.rank}, {self.missions} missions)"
 
 
+# Shared mapping for the common "max stats" case so no dict is built per soldier
+_MAX_STATS_100 = {stat_name: 100 for stat_name in Soldier.STATS}
+
+
 class SoldierManager(BaseManager):
     """Manages soldiers/agents across all bases."""
     
     def get_all_soldiers(self) -> List[Soldier]:
         """Get all soldiers from all bases."""
         soldiers = []
-        bases = self.get_current_value('bases')
-        
-        if not isinstance(bases, list):
-            return soldiers
         
-        for base_index, base in enumerate(bases):
-            if not isinstance(base, dict) or 'soldiers' not in base:
+        for base_index, base in self._bases():
+            if 'soldiers' not in base:
                 continue
             
             soldier_list = base['soldiers']
@@ -120,13 +124,9 @@ class SoldierManager(BaseManager):
             soldier: The soldier to modify
             max_value: Maximum value for all stats (default 100)
         """
-        max_value = max(1, min(255, max_value))  # Clamp between 1 and 255
-        
-        stats_to_set = {}
-        for stat_name in Soldier.STATS:
-            stats_to_set[stat_name] = max_value
-        
-        self.set_soldier_stats(soldier, stats_to_set)
+        self._before_write('bases')
+        soldier.set_stats_bulk(self._max_stats(max_value))
+        self._mark_changed()
     
     def set_all_soldiers_stats_to_max(self, max_value: int = 100) -> int:
         """
@@ -139,10 +139,15 @@ class SoldierManager(BaseManager):
             Number of soldiers modified
         """
         soldiers = self.get_all_soldiers()
+        stats = self._max_stats(max_value)
         
+        if soldiers:
+            self._before_write('bases')
         for soldier in soldiers:
-            self.set_soldier_stats_to_max(soldier, max_value)
+            soldier.set_stats_bulk(stats)
         
+        if soldiers:
+            self._mark_changed()
         return len(soldiers)
     
     def set_base_soldiers_stats_to_max(self, base_index: int, max_value: int = 100) -> int:
@@ -157,12 +162,25 @@ class SoldierManager(BaseManager):
             Number of soldiers modified
         """
         soldiers = self.get_soldiers_by_base(base_index)
+        stats = self._max_stats(max_value)
         
+        if soldiers:
+            self._before_write('bases')
         for soldier in soldiers:
-            self.set_soldier_stats_to_max(soldier, max_value)
+            soldier.set_stats_bulk(stats)
         
+        if soldiers:
+            self._mark_changed()
         return len(soldiers)
     
+    @staticmethod
+    def _max_stats(max_value: int) -> Dict[str, int]:
+        """Build the stat mapping for a max-stats write, clamped to 1-255."""
+        max_value = max(1, min(255, max_value))  # Clamp between 1 and 255
+        if max_value == 100:
+            return _MAX_STATS_100
+        return dict.fromkeys(Soldier.STATS, max_value)
+    
     def get_base_names(self) -> List[str]:
         """Get names of all bases."""
         bases = self.get_current_value('bases')
@@ -180,12 +198,19 @@ class SoldierManager(BaseManager):
     
     def get_soldier_summary(self) -> Dict[str, Any]:
         """Get a summary of soldier status across all bases."""
-        all_soldiers = self.get_all_soldiers()
-        base_names = self.get_base_names()
-        base_summaries = []
+        bases = self.get_current_value('bases')
+        if not isinstance(bases, list):
+            bases = []
+        
+        # Group soldiers by base in one pass, then walk the bases once for names
+        by_base: Dict[int, List[Soldier]] = {}
+        for soldier in self.get_all_soldiers():
+            by_base.setdefault(soldier.base_index, []).append(soldier)
         
-        for i, base_name in enumerate(base_names):
-            base_soldiers = self.get_soldiers_by_base(i)
+        base_summaries = []
+        for i, base in enumerate(bases):
+            base_name = base['name'] if isinstance(base, dict) and 'name' in base else f"Base {i + 1}"
+            base_soldiers = by_base.get(i, ())
             
             base_summaries.append({
                 'name': base_name,
@@ -202,7 +227,7 @@ class SoldierManager(BaseManager):
             })
         
         return {
-            'total_soldiers': len(all_soldiers),
+            'total_soldiers': sum(len(soldiers) for soldiers in by_base.values()),
             'bases': base_summaries
         }
     
@@ -244,7 +269,7 @@ class SoldierManager(BaseManager):
         }
         
         # Compare original and current soldier states
-        original_soldiers = SoldierManager(self.original_data).get_all_soldiers()
+        original_soldiers = SoldierManager._read_only(self.original_data).get_all_soldiers()
         current_soldiers = self.get_all_soldiers()
         
         modified_count = 0
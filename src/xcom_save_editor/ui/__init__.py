@@ -2,9 +2,31 @@
 Enhanced UI components for OpenXCom Save Editor.
 """
 
-from .theme import Theme, get_current_theme, set_theme, get_available_themes
-from .layout import LayoutManager
-from .renderer import UIRenderer
-from . import widgets
-
 __all__ = ['Theme', 'get_current_theme', 'set_theme', 'get_available_themes', 'LayoutManager', 'UIRenderer', 'widgets']
+
+# Public names resolved on first access so importing one submodule (e.g. the
+# theme table for CLI option parsing) doesn't pull in the whole Rich layout stack
+_LAZY = {
+    'Theme': '.theme',
+    'get_current_theme': '.theme',
+    'set_theme': '.theme',
+    'get_available_themes': '.theme',
+    'LayoutManager': '.layout',
+    'UIRenderer': '.renderer',
+}
+
+
+def __getattr__(name):
+    import importlib
+    if name == 'widgets':
+        return importlib.import_module('.widgets', __name__)
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY) + ['widgets']
@@ -2,7 +2,7 @@
 UI Renderer that provides a consistent abstraction layer for all interface elements.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.live import Live
 from rich.layout import Layout
@@ -182,17 +182,21 @@ class UIRenderer:
         from .theme import set_theme
         
         if set_theme(theme_name):
-            # Update our references
-            self.theme = get_current_theme()
-            self.layout_manager.theme = self.theme
-            
-            # Apply new theme to console
-            self.console._theme_stack.clear()
-            self.console.push_theme(self.theme.rich_theme)
+            self.refresh_theme()
             return True
         return False
     
-    def get_available_themes(self) -> List[str]:
+    def refresh_theme(self):
+        """Re-apply the globally active theme without rebuilding the renderer."""
+        # Update our references
+        self.theme = get_current_theme()
+        self.layout_manager.theme = self.theme
+        
+        # Swap the theme we pushed in __init__ for the new one
+        self.console.pop_theme()
+        self.console.push_theme(self.theme.rich_theme)
+    
+    def get_available_themes(self) -> Tuple[str, ...]:
         """Get list of available theme names."""
         from .theme import get_available_themes
         return get_available_themes()
@@ -2,7 +2,8 @@
 Theme management system for the OpenXCom Save Editor UI.
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from rich.theme import Theme as RichTheme
 from rich.style import Style
 from pathlib import Path
@@ -139,9 +140,10 @@ def set_theme(theme_name: str) -> bool:
     return True
 
 
-def get_available_themes() -> list[str]:
-    """Get list of available theme names."""
-    return list(Theme.THEMES.keys())
+@lru_cache(maxsize=1)
+def get_available_themes() -> Tuple[str, ...]:
+    """Get the available theme names (cached; the theme table is static)."""
+    return tuple(Theme.THEMES)
 
 
 def _load_theme_from_config() -> str:
@@ -3,11 +3,14 @@ Utilities package for OpenXCom save editor.
 """
 
 from .file_ops import SaveFileManager
-from .validator import SaveGameValidator, quick_validate_save, detailed_validate_save
+from .validator import (
+    SaveGameValidator, quick_validate_save, detailed_validate_save, validate_save_branches
+)
 
 __all__ = [
     'SaveFileManager',
     'SaveGameValidator', 
     'quick_validate_save',
-    'detailed_validate_save'
+    'detailed_validate_save',
+    'validate_save_branches'
 ]
\ No newline at end of file
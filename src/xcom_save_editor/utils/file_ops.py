@@ -2,14 +2,22 @@
 File operations utilities for OpenXCom save file management.
 Handles YAML I/O, backups, and file restoration.
 """
+import codecs
 import os
 import shutil
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
+# libyaml bindings are much faster; PyYAML builds without them fall back to pure Python
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 
 class SaveFileManager:
     """Manages save file operations including backup and restore functionality."""
@@ -19,51 +27,122 @@ class SaveFileManager:
         self.backup_dir = self.save_path.parent / "backups"
         self.backup_dir.mkdir(exist_ok=True)
         self.header_data = None  # Store the header document
+        # YAML text of each top-level entry of the main document as last read or
+        # written; lets save_file copy untouched entries instead of re-dumping them
+        self._raw_branches: Dict[str, str] = {}
         
     def load_save_file(self) -> Dict[str, Any]:
         """Load OpenXCom save file preserving order."""
         if not self.save_path.exists():
             raise FileNotFoundError(f"Save file not found: {self.save_path}")
             
-        with open(self.save_path, 'r', encoding='utf-8') as f:
-            # OpenXCom saves can have multiple YAML documents
-            # We want the second document (after the --- separator)
-            try:
-                documents = list(yaml.load_all(f, Loader=yaml.CLoader))
-            except AttributeError:
-                f.seek(0)  # Reset file position
-                documents = list(yaml.load_all(f, Loader=yaml.Loader))
-            
-            # Store the header document for later saving
-            if len(documents) >= 2:
-                self.header_data = documents[0]
-                return documents[1]
-            elif len(documents) == 1:
-                self.header_data = None  # Single document format
-                return documents[0]
-            else:
-                raise ValueError("No valid YAML documents found in save file")
+        # One read of the whole file; the YAML parser works on the in-memory buffer
+        raw = self.save_path.read_bytes()
+        # Drop a UTF-8 BOM up front: libyaml and the pure-Python parser disagree on
+        # whether it counts towards mark offsets, which _split_branches relies on
+        if raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+        
+        # OpenXCom saves can have multiple YAML documents
+        # We want the second document (after the --- separator)
+        documents = []
+        nodes = []
+        loader = _SafeLoader(raw)
+        try:
+            while loader.check_node():
+                node = loader.get_node()
+                nodes.append(node)
+                documents.append(loader.construct_document(node))
+        finally:
+            loader.dispose()
+        
+        # Store the header document for later saving
+        if len(documents) >= 2:
+            self.header_data = documents[0]
+            main_index = 1
+        elif len(documents) == 1:
+            self.header_data = None  # Single document format
+            main_index = 0
+        else:
+            raise ValueError("No valid YAML documents found in save file")
+        
+        self._raw_branches = self._split_branches(raw, nodes[main_index])
+        return documents[main_index]
     
-    def save_file(self, data: Dict[str, Any]) -> None:
-        """Save data to YAML file with proper formatting."""
-        with open(self.save_path, 'w', encoding='utf-8') as f:
-            # If we have header data, write it first
-            if self.header_data is not None:
-                yaml.dump(self.header_data, f,
-                         default_flow_style=False,
-                         allow_unicode=True,
-                         width=120,
-                         indent=2,
-                         sort_keys=False)
-                f.write("---\n")  # Document separator
+    @staticmethod
+    def _split_branches(raw: bytes, node: Any) -> Dict[str, str]:
+        """Cut the source text of a top-level block mapping into one chunk per key."""
+        if not isinstance(node, yaml.MappingNode) or node.flow_style or not node.value:
+            return {}
+        
+        # Parser marks are character offsets, so slice the decoded text
+        text = raw.decode('utf-8')
+        starts = [key_node.start_mark.index for key_node, _ in node.value]
+        ends = starts[1:] + [node.value[-1][1].end_mark.index]
+        
+        branches = {}
+        for (key_node, _), start, end in zip(node.value, starts, ends):
+            if not isinstance(key_node, yaml.ScalarNode) or key_node.tag != 'tag:yaml.org,2002:str':
+                return {}  # Only plain string keys can be matched back to the data
+            chunk = text[start:end]
+            if not chunk.startswith(key_node.value + ':'):
+                return {}  # Offsets don't line up with the text; re-dump everything
+            branches[key_node.value] = chunk if chunk.endswith('\n') else chunk + '\n'
+        return branches
+    
+    def save_file(self, data: Dict[str, Any], changed_keys: Optional[Iterable[str]] = None) -> None:
+        """Save data to YAML file with proper formatting.
+        
+        The YAML is streamed into a temporary file next to the save, flushed to
+        disk and then renamed over the save, so a crash mid-write never leaves
+        a truncated save behind.
+        
+        Args:
+            data: The main game data document
+            changed_keys: Top-level keys edited since the file was last read or
+                written. Every other entry is copied from its previous YAML text
+                instead of being serialised again. None re-serialises everything.
+        """
+        dump_options = dict(Dumper=_SafeDumper,
+                            default_flow_style=False,
+                            allow_unicode=True,
+                            width=120,
+                            indent=2,
+                            sort_keys=False)
+        
+        raw_branches = self._raw_branches if changed_keys is not None and data else {}
+        changed_keys = set(changed_keys or ())
+        new_branches: Dict[str, str] = {}
+        tmp_path = self.save_path.with_name(self.save_path.name + '.tmp')
+        
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                # If we have header data, write it first
+                if self.header_data is not None:
+                    yaml.dump(self.header_data, f, encoding='utf-8', **dump_options)
+                    f.write(b"---\n")  # Document separator
+                
+                # Write the main game data one top-level entry at a time
+                if not data:
+                    yaml.dump(data, f, encoding='utf-8', **dump_options)
+                for key, value in data.items():
+                    chunk = raw_branches.get(key) if key not in changed_keys else None
+                    if chunk is None:
+                        chunk = yaml.dump({key: value}, **dump_options)
+                    new_branches[key] = chunk
+                    f.write(chunk.encode('utf-8'))
+                
+                f.flush()
+                os.fsync(f.fileno())
             
-            # Write the main game data
-            yaml.dump(data, f, 
-                     default_flow_style=False,
-                     allow_unicode=True,
-                     width=120,
-                     indent=2,
-                     sort_keys=False)
+            if self.save_path.exists():
+                shutil.copymode(self.save_path, tmp_path)
+            os.replace(tmp_path, self.save_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        self._raw_branches = {key: chunk for key, chunk in new_branches.items() if isinstance(key, str)}
     
     def create_backup(self) -> str:
         """Create a timestamped backup of the current save file."""
@@ -79,15 +158,29 @@ class SaveFileManager:
     
     def list_backups(self) -> list[str]:
         """List available backup files sorted by creation time (newest first)."""
-        if not self.backup_dir.exists():
-            return []
-        
+        return [path for path, _, _ in self.list_backups_with_stat()]
+    
+    def list_backups_with_stat(self) -> List[Tuple[str, int, float]]:
+        """List backups as (path, size, mtime) tuples, newest first, from one directory scan."""
+        prefix = f"{self.save_path.stem}_"
         backups = []
-        for backup_file in self.backup_dir.glob(f"{self.save_path.stem}_*.bak"):
-            backups.append(str(backup_file))
+        
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(prefix) and name.endswith('.bak')):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    backups.append((entry.path, stat.st_size, stat.st_mtime))
+        except FileNotFoundError:
+            return []
         
         # Sort by modification time, newest first
-        backups.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        backups.sort(key=itemgetter(2), reverse=True)
         return backups
     
     def restore_backup(self, backup_path: str) -> None:
@@ -2,7 +2,7 @@
 Validation utilities for OpenXCom save file integrity and structure.
 Provides basic validation checks to ensure save files remain functional.
 """
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 class SaveGameValidator:
@@ -23,6 +23,15 @@ class SaveGameValidator:
         'difficulty': int,
     }
     
+    # Structure checks for individual top-level branches (see validate_branches)
+    BRANCH_VALIDATORS = {
+        'funds': '_validate_funds',
+        'bases': '_validate_bases',
+    }
+    
+    # Top-level keys covered by _check_reasonable_values
+    RANGE_CHECKED_KEYS = frozenset(('time', 'monthsPassed', 'daysPassed'))
+    
     def __init__(self):
         self.errors: List[str] = []
         self.warnings: List[str] = []
@@ -52,6 +61,32 @@ class SaveGameValidator:
         
         return len(self.errors) == 0, self.errors.copy(), self.warnings.copy()
     
+    def validate_branches(self, data: Dict[str, Any], keys: Iterable[str]) -> Tuple[bool, List[str], List[str]]:
+        """
+        Validate only the given top-level branches, e.g. the ones edited since load.
+        Returns (is_valid, errors, warnings).
+        """
+        self.errors.clear()
+        self.warnings.clear()
+        
+        keys = set(keys)
+        for key in keys:
+            if key not in data:
+                if key in self.REQUIRED_KEYS:
+                    self.errors.append(f"Missing required key: {key}")
+                continue
+            
+            self._check_data_type(data, key)
+            
+            validator_name = self.BRANCH_VALIDATORS.get(key)
+            if validator_name is not None:
+                getattr(self, validator_name)(data[key])
+        
+        if not keys.isdisjoint(self.RANGE_CHECKED_KEYS):
+            self._check_reasonable_values(data)
+        
+        return len(self.errors) == 0, self.errors.copy(), self.warnings.copy()
+    
     def _check_required_keys(self, data: Dict[str, Any]) -> None:
         """Check that all required keys are present."""
         for key in self.REQUIRED_KEYS:
@@ -60,9 +95,15 @@ class SaveGameValidator:
     
     def _check_data_types(self, data: Dict[str, Any]) -> None:
         """Validate data types for critical fields."""
-        for key, expected_type in self.TYPE_VALIDATORS.items():
-            if key in data and not isinstance(data[key], expected_type):
-                self.errors.append(f"Invalid type for {key}: expected {expected_type.__name__}, got {type(data[key]).__name__}")
+        for key in self.TYPE_VALIDATORS:
+            if key in data:
+                self._check_data_type(data, key)
+    
+    def _check_data_type(self, data: Dict[str, Any], key: str) -> None:
+        """Validate the data type of one top-level field, if it has an expected type."""
+        expected_type = self.TYPE_VALIDATORS.get(key)
+        if expected_type is not None and not isinstance(data[key], expected_type):
+            self.errors.append(f"Invalid type for {key}: expected {expected_type.__name__}, got {type(data[key]).__name__}")
     
     def _validate_funds(self, funds: Any) -> None:
         """Validate funds structure and values."""
@@ -226,4 +267,10 @@ def quick_validate_save(data: Dict[str, Any]) -> bool:
 def detailed_validate_save(data: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
     """Detailed validation - returns (is_valid, errors, warnings)."""
     validator = SaveGameValidator()
-    return validator.validate_save_structure(data)
\ No newline at end of file
+    return validator.validate_save_structure(data)
+
+
+def validate_save_branches(data: Dict[str, Any], keys: Iterable[str]) -> Tuple[bool, List[str], List[str]]:
+    """Validate only the given top-level branches - returns (is_valid, errors, warnings)."""
+    validator = SaveGameValidator()
+    return validator.validate_branches(data, keys)
@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration.
+
+Makes the package under ``src/`` importable when it has not been
+installed with ``pip install -e .``.
+"""
+import os
+import sys
+
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+_SRC = os.path.normpath(_SRC)
+
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -6,13 +6,10 @@ import tempfile
 import shutil
 from pathlib import Path
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from xcom_save_editor import OpenXComSaveEditor
+from xcom_save_editor.game_editors.soldier_manager import Soldier
 from xcom_save_editor.utils.file_ops import SaveFileManager
-from xcom_save_editor.utils.validator import detailed_validate_save
+from xcom_save_editor.utils.validator import detailed_validate_save, validate_save_branches
 
 
 @pytest.fixture
@@ -78,6 +75,18 @@ def test_editor_status(sample_save_path):
     assert isinstance(status['funds']['previous'], int)
 
 
+def test_quick_status_cache_follows_edits(temp_save_file):
+    """Test that cached status is reused until an edit, then rebuilt."""
+    editor = OpenXComSaveEditor(temp_save_file)
+    status = editor.get_quick_status()
+    assert editor.get_quick_status() is status
+    
+    editor.money_manager.add_funds(1000)
+    updated = editor.get_quick_status()
+    assert updated is not status
+    assert updated['funds']['current'] == status['funds']['current'] + 1000
+
+
 def test_money_manager(temp_save_file):
     """Test money editing functionality."""
     editor = OpenXComSaveEditor(temp_save_file)
@@ -109,6 +118,7 @@ def test_research_manager(sample_save_path):
     assert isinstance(all_projects, list)
     assert isinstance(active_projects, list)
     assert len(active_projects) <= len(all_projects)
+    assert research_manager.count_active() == len(active_projects)
     
     # Test research summary
     summary = research_manager.get_research_summary()
@@ -133,6 +143,20 @@ def test_soldier_manager(sample_save_path):
         assert isinstance(soldier.current_stats, dict)
 
 
+def test_soldier_bulk_max_stats(sample_save_path):
+    """Bulk max-stats write touches every stat and flags the change."""
+    editor = OpenXComSaveEditor(sample_save_path)
+    soldier_manager = editor.soldier_manager
+    
+    modified = soldier_manager.set_all_soldiers_stats_to_max(120)
+    assert modified == len(soldier_manager.get_all_soldiers())
+    
+    if modified:
+        assert soldier_manager.has_changes()
+        soldier = soldier_manager.get_all_soldiers()[0]
+        assert all(soldier.get_stat(stat) == 120 for stat in Soldier.STATS)
+
+
 def test_facility_manager(sample_save_path):
     """Test facility management functionality."""
     editor = OpenXComSaveEditor(sample_save_path)
@@ -145,6 +169,7 @@ def test_facility_manager(sample_save_path):
     assert isinstance(all_facilities, list)
     assert isinstance(under_construction, list)
     assert len(under_construction) <= len(all_facilities)
+    assert facility_manager.count_under_construction() == len(under_construction)
 
 
 def test_production_manager(sample_save_path):
@@ -159,6 +184,7 @@ def test_production_manager(sample_save_path):
     assert isinstance(all_items, list)
     assert isinstance(active_items, list)
     assert len(active_items) <= len(all_items)
+    assert production_manager.count_active() == len(active_items)
 
 
 def test_inventory_manager(sample_save_path):
@@ -175,6 +201,45 @@ def test_inventory_manager(sample_save_path):
     assert isinstance(all_items, list)
 
 
+def test_inventory_search(sample_save_path):
+    """Test that lazy and eager item search agree."""
+    editor = OpenXComSaveEditor(sample_save_path)
+    inventory_manager = editor.inventory_manager
+    
+    all_items = inventory_manager.get_all_unique_items()
+    if not all_items:
+        pytest.skip("Sample save has no items")
+    
+    # Search by a fragment of a real item name
+    term = inventory_manager._format_item_name(all_items[0]).lower()[:4]
+    matches = inventory_manager.search_items(term)
+    
+    assert all_items[0] in matches
+    assert dict(inventory_manager.isearch_items(term)) == matches
+
+
+def test_inventory_changes_summary_per_base():
+    """Test that inventory diffs cover every base edited, by index or as a whole."""
+    from xcom_save_editor.game_editors.inventory_manager import InventoryManager
+    
+    data = {'bases': [{'items': {'STR_A': 1}}, {'items': {'STR_B': 2}}]}
+    manager = InventoryManager(data)
+    
+    manager.add_item(0, 'STR_A', 1)
+    manager.bulk_modify_items(1, {'STR_C': 3})
+    modified = manager.get_changes_summary()['modified']
+    assert modified['inventory_items']['current'] == "2 item quantities changed in 2 base(s)"
+    
+    # Replacing the whole list still compares every base
+    bases = manager.get_current_value('bases')
+    manager.set_value('bases', [bases[0], {'items': {'STR_B': 2}}])
+    modified = manager.get_changes_summary()['modified']
+    assert modified['inventory_items']['current'] == "1 item quantities changed in 1 base(s)"
+    
+    manager.reset_changes()
+    assert manager.get_changes_summary()['modified'] == {}
+
+
 def test_backup_creation(temp_save_file):
     """Test backup functionality."""
     editor = OpenXComSaveEditor(temp_save_file)
@@ -201,16 +266,32 @@ def test_validation(sample_save_path):
     assert isinstance(warnings, list)
 
 
+def test_branch_validation(sample_save_path):
+    """Test that branch validation only checks the requested branches."""
+    editor = OpenXComSaveEditor(sample_save_path)
+    data = dict(editor.save_data, funds=[1])
+    
+    is_valid, errors, _ = validate_save_branches(data, ['funds'])
+    assert is_valid is False
+    assert any('Funds' in error for error in errors)
+    
+    is_valid, errors, _ = validate_save_branches(data, ['bases'])
+    assert is_valid is True
+    assert errors == []
+
+
 def test_changes_tracking(temp_save_file):
     """Test change tracking functionality."""
     editor = OpenXComSaveEditor(temp_save_file)
     
     # Initially no changes
     assert editor.has_changes() is False
+    original_funds = editor.money_manager.get_funds_display()
     
     # Make a change
     editor.money_manager.set_current_month_funds(9999999)
     assert editor.has_changes() is True
+    assert editor.original_save_data['funds'] != editor.save_data['funds']
     
     # Get changes summary
     changes = editor.get_all_changes_summary()
@@ -220,6 +301,86 @@ def test_changes_tracking(temp_save_file):
     # Reset changes
     editor.reset_all_changes()
     assert editor.has_changes() is False
+    assert editor.money_manager.get_funds_display() == original_funds
+
+
+def test_manager_original_is_copy_on_write(temp_save_file):
+    """Test that manager originals share untouched branches and keep edited ones."""
+    editor = OpenXComSaveEditor(temp_save_file)
+    original_funds = list(editor.save_data['funds'])
+    
+    editor.money_manager.add_funds(1000)
+    original = editor.money_manager.original_data
+    assert original['funds'] == original_funds
+    assert original['bases'] is editor.save_data['bases']
+    
+    # After a commit the saved state becomes the original
+    assert editor.commit_changes(create_backup=False) is True
+    assert editor.money_manager.get_original_value('funds') == editor.save_data['funds']
+
+
+def test_manager_reset_restores_edited_branches():
+    """Test that reset_changes only replaces the branches the manager edited."""
+    from xcom_save_editor.game_editors.money_manager import MoneyManager
+    
+    data = {'funds': [100, 200], 'bases': [{'name': 'Alpha'}]}
+    manager = MoneyManager(data)
+    bases = data['bases']
+    
+    manager.reset_changes()
+    assert manager.mutation_count == 0
+    
+    manager.set_current_month_funds(500)
+    manager.reset_changes()
+    assert manager.has_changes() is False
+    assert data['funds'] == [100, 200]
+    assert data['bases'] is bases
+
+
+def test_manager_reset_keeps_other_bases():
+    """Test that reset_changes restores only the bases the manager edited."""
+    from xcom_save_editor.game_editors.research_manager import ResearchManager
+    from xcom_save_editor.game_editors.production_manager import ProductionManager
+    
+    data = {'bases': [{'name': 'Alpha'}, {'name': 'Beta'}]}
+    research = ResearchManager(data)
+    production = ProductionManager(data)
+    
+    research.set_value('bases.0.name', 'Edited Alpha')
+    production.set_value('bases.1.name', 'Edited Beta')
+    research.reset_changes()
+    assert data['bases'][0]['name'] == 'Alpha'
+    assert data['bases'][1]['name'] == 'Edited Beta'
+    
+    production.set_value('bases', [{'name': 'Gamma'}])
+    production.reset_changes()
+    assert [base['name'] for base in data['bases']] == ['Alpha', 'Beta']
+
+
+def test_changes_reverted_by_hand(temp_save_file):
+    """Test that editing a value back to its original clears has_changes()."""
+    editor = OpenXComSaveEditor(temp_save_file)
+    current, previous = editor.money_manager.get_funds_display()
+    
+    editor.money_manager.set_current_month_funds(current + 1)
+    assert editor.has_changes() is True
+    
+    editor.money_manager.set_current_month_funds(current)
+    assert editor.has_changes() is False
+    assert editor.get_all_changes_summary()['modified'] == {}
+
+
+def test_editor_deepcopy_is_independent(sample_save_path):
+    """Test that a deep-copied editor edits its own data and tracks its own changes."""
+    import copy
+    
+    editor = OpenXComSaveEditor(sample_save_path)
+    clone = copy.deepcopy(editor)
+    assert clone.money_manager.current_data is clone.save_data
+    
+    clone.money_manager.add_funds(1000)
+    assert clone.has_changes() is True
+    assert editor.has_changes() is False
 
 
 def test_multi_base_support(sample_save_path):
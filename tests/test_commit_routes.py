@@ -6,11 +6,6 @@ import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from xcom_save_editor import OpenXComSaveEditor
 from xcom_save_editor.cli import SaveEditorCLI
@@ -189,5 +184,60 @@ def test_changes_tracking_after_commit(temp_save_file):
     assert editor.has_changes() is True
 
 
+def test_commit_keeps_untouched_branches(temp_save_file):
+    """Test that a commit rewriting only edited branches reloads to the same data."""
+    editor = OpenXComSaveEditor(temp_save_file)
+    editor.money_manager.set_current_month_funds(7654321)
+    assert editor.commit_changes(create_backup=False) is True
+    
+    reloaded = OpenXComSaveEditor(temp_save_file)
+    assert reloaded.save_data == editor.save_data
+    
+    # A second commit works from the text written by the first
+    editor.money_manager.add_funds(1000)
+    assert editor.commit_changes(create_backup=False) is True
+    assert OpenXComSaveEditor(temp_save_file).save_data == editor.save_data
+
+
+def test_commit_keeps_branches_after_bom(tmp_path):
+    """Test that reusing unchanged branches stays aligned when the save starts with a BOM."""
+    save_path = tmp_path / "bom.sav"
+    save_path.write_bytes(
+        "\ufeffname: x\n---\nfoo: \u00dcn\u00ef\nbases: []\nfunds: [1, 2]\ntime: 5\n".encode('utf-8')
+    )
+    
+    editor = OpenXComSaveEditor(str(save_path))
+    editor.money_manager.add_funds(1000)
+    assert editor.commit_changes(create_backup=False) is True
+    
+    reloaded = OpenXComSaveEditor(str(save_path))
+    assert reloaded.save_data == editor.save_data
+    assert reloaded.save_data['time'] == 5
+
+
+def test_cli_mutation_counter_tracking(temp_save_file):
+    """Test that the CLI's counter-based change check follows edit, save and reset."""
+    cli = SaveEditorCLI()
+    cli.editor = OpenXComSaveEditor(temp_save_file)
+    assert cli._has_changes() is False
+    
+    cli.editor.money_manager.add_funds(1000)
+    assert cli._has_changes() is True
+    
+    with patch('xcom_save_editor.cli.inquirer') as mock_inquirer:
+        mock_inquirer.confirm.return_value.execute.return_value = True
+        assert cli.handle_save_on_exit() is True
+    assert cli._has_changes() is False
+    
+    cli.editor.money_manager.add_funds(1000)
+    assert cli._has_changes() is True
+    
+    with patch('xcom_save_editor.cli.inquirer') as mock_inquirer:
+        mock_inquirer.confirm.return_value.execute.return_value = True
+        cli.handle_reset()
+    assert cli._has_changes() is False
+    assert cli.editor.has_changes() is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -3,11 +3,6 @@ Tests for OpenXCom Save Editor info extraction from header document.
 """
 import pytest
 from pathlib import Path
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from xcom_save_editor import OpenXComSaveEditor
 
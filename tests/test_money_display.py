@@ -3,11 +3,6 @@ Tests for MoneyManager funds display and labeling.
 """
 import pytest
 from pathlib import Path
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from xcom_save_editor import OpenXComSaveEditor
 from xcom_save_editor.game_editors.money_manager import MoneyManager